@@ -11,6 +11,7 @@ from pathlib import Path
 
 from alembic import context
 from sqlalchemy import pool
+from sqlalchemy.engine import Connection
 from sqlmodel import SQLModel
 
 # Add the src directory to sys.path for imports
@@ -64,22 +65,36 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_with_connection(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
     Connects to the database and applies migrations directly.
+
+    Callers that already hold a connection (tests, or tooling migrating
+    several databases) can pass it via
+    `alembic_cfg.attributes["connection"] = engine.connect()`; it is used
+    as-is instead of building a new engine from the environment.
     """
+    connection = config.attributes.get("connection", None)
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
     db_config = DatabaseConfig.from_env()
     connectable = create_engine_from_config(db_config)
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_with_connection(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,39 @@
+"""Replace single-column to_gav index with covering (to_gav, from_gav) index
+
+Revision ID: 002_edge_to_from_index
+Revises: 001_initial_schema
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002_edge_to_from_index"
+down_revision: Union[str, None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reverse lookups select from_gav by to_gav; covering both columns lets
+    # the database answer them from the index without touching the table.
+    op.create_index(
+        "ix_dep_to_from",
+        "dependencyedge",
+        ["to_gav", "from_gav"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_dependencyedge_to_gav"), table_name="dependencyedge")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_dependencyedge_to_gav"),
+        "dependencyedge",
+        ["to_gav"],
+        unique=False,
+    )
+    op.drop_index("ix_dep_to_from", table_name="dependencyedge")
@@ -0,0 +1,32 @@
+"""Drop ix_dependencyedge_from_gav, covered by the uq_dep_edge unique index
+
+Revision ID: 003_drop_edge_from_gav_index
+Revises: 002_edge_to_from_index
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_drop_edge_from_gav_index"
+down_revision: Union[str, None] = "002_edge_to_from_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # uq_dep_edge (from_gav, to_gav, scope, optional) already serves from_gav
+    # prefix lookups; the extra index only added a B-tree write per INSERT.
+    op.drop_index(op.f("ix_dependencyedge_from_gav"), table_name="dependencyedge")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_dependencyedge_from_gav"),
+        "dependencyedge",
+        ["from_gav"],
+        unique=False,
+    )
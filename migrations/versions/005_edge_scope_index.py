@@ -0,0 +1,31 @@
+"""Index dependencyedge.scope
+
+Revision ID: 005_edge_scope_index
+Revises: 003_drop_edge_from_gav_index
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_edge_scope_index"
+down_revision: Union[str, None] = "003_drop_edge_from_gav_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The distinct-scope lists read only this column.
+    op.create_index(
+        "ix_dep_scope",
+        "dependencyedge",
+        ["scope"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dep_scope", table_name="dependencyedge")
@@ -0,0 +1,33 @@
+"""Add the graphversion counter table
+
+Revision ID: 006_graph_version
+Revises: 005_edge_scope_index
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_graph_version"
+down_revision: Union[str, None] = "005_edge_scope_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row; uploads bump `version` in the same transaction as their rows.
+    graphversion = op.create_table(
+        "graphversion",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(graphversion, [{"id": 1, "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("graphversion")
@@ -7,13 +7,21 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+# PostgreSQL allows 65535 bind parameters per statement, and the widest
+# bulk-inserted rows (artifact, dependencyedge) take 4 each.
+MAX_INSERT_PAGE_SIZE = 65535 // 4
+
+
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration container.
 
+    Frozen (and therefore hashable) so engines can be memoized per config.
+
     Attributes:
         db_type: Database type, either "sqlite" or "postgresql"
         sqlite_path: Path to SQLite database file (only for sqlite)
@@ -22,6 +30,8 @@ class DatabaseConfig:
         user: Database user
         password: Database password (optional if using IAM auth)
         gcp_credentials_path: Path to GCP service account JSON key file
+        insert_page_size: Rows per multi-row INSERT batch on PostgreSQL
+            (None = default; at most `MAX_INSERT_PAGE_SIZE`). Unused by SQLite.
     """
 
     db_type: str  # "sqlite" or "postgresql"
@@ -36,10 +46,18 @@ class DatabaseConfig:
     password: str | None = None
     gcp_credentials_path: Path | None = None
 
+    # Bulk insert tuning
+    insert_page_size: int | None = None
+
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
         """Create configuration from environment variables.
 
+        The result is cached for the life of the process, so repeated callers
+        (app startup, Alembic's offline and online paths) don't re-read the
+        environment or re-resolve paths. Call `_config_from_env.cache_clear()`
+        after changing the environment, e.g. in tests.
+
         Environment variables:
             JDEP_DB_TYPE: "sqlite" or "postgresql" (default: "sqlite")
             JDEP_DB_PATH: SQLite database path (default: "dependencies.db")
@@ -48,26 +66,9 @@ class DatabaseConfig:
             JDEP_DB_USER: Database user
             JDEP_DB_PASSWORD: Database password
             JDEP_GCP_CREDENTIALS: Path to GCP service account JSON key
+            JDEP_INSERT_PAGE_SIZE: Rows per multi-row INSERT batch, PostgreSQL only (optional)
         """
-        db_type = os.getenv("JDEP_DB_TYPE", "sqlite").lower()
-
-        if db_type == "sqlite":
-            return cls(
-                db_type="sqlite",
-                sqlite_path=Path(os.getenv("JDEP_DB_PATH", "dependencies.db")).resolve(),
-            )
-
-        # PostgreSQL / CloudSQL configuration
-        gcp_creds = os.getenv("JDEP_GCP_CREDENTIALS")
-
-        return cls(
-            db_type="postgresql",
-            host=os.getenv("JDEP_DB_HOST"),
-            database=os.getenv("JDEP_DB_NAME", "jdep"),
-            user=os.getenv("JDEP_DB_USER"),
-            password=os.getenv("JDEP_DB_PASSWORD"),
-            gcp_credentials_path=Path(gcp_creds) if gcp_creds else None,
-        )
+        return _config_from_env()
 
     def validate(self) -> None:
         """Validate the configuration.
@@ -75,6 +76,9 @@ class DatabaseConfig:
         Raises:
             ValueError: If required configuration is missing.
         """
+        if self.insert_page_size is not None and not 1 <= self.insert_page_size <= MAX_INSERT_PAGE_SIZE:
+            raise ValueError(f"JDEP_INSERT_PAGE_SIZE must be between 1 and {MAX_INSERT_PAGE_SIZE}")
+
         if self.db_type == "sqlite":
             if not self.sqlite_path:
                 raise ValueError("JDEP_DB_PATH is required for SQLite")
@@ -85,3 +89,31 @@ class DatabaseConfig:
                 raise ValueError("JDEP_DB_USER is required for PostgreSQL")
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
+
+
+@lru_cache(maxsize=1)
+def _config_from_env() -> DatabaseConfig:
+    """Build (once) the configuration returned by `DatabaseConfig.from_env`."""
+    db_type = os.getenv("JDEP_DB_TYPE", "sqlite").lower()
+    page_size = os.getenv("JDEP_INSERT_PAGE_SIZE")
+    insert_page_size = int(page_size) if page_size else None
+
+    if db_type == "sqlite":
+        return DatabaseConfig(
+            db_type="sqlite",
+            sqlite_path=Path(os.getenv("JDEP_DB_PATH", "dependencies.db")).resolve(),
+            insert_page_size=insert_page_size,
+        )
+
+    # PostgreSQL / CloudSQL configuration
+    gcp_creds = os.getenv("JDEP_GCP_CREDENTIALS")
+
+    return DatabaseConfig(
+        db_type="postgresql",
+        host=os.getenv("JDEP_DB_HOST"),
+        database=os.getenv("JDEP_DB_NAME", "jdep"),
+        user=os.getenv("JDEP_DB_USER"),
+        password=os.getenv("JDEP_DB_PASSWORD"),
+        gcp_credentials_path=Path(gcp_creds) if gcp_creds else None,
+        insert_page_size=insert_page_size,
+    )
@@ -4,14 +4,17 @@ Supports both SQLite and PostgreSQL via GCP CloudSQL.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import event, insert, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, create_engine
 
 from j_dep_analyzer.config import DatabaseConfig
+from j_dep_analyzer.db_models import GraphVersion
 
 
 # Global connector instance to be reused across connections
@@ -30,9 +33,43 @@ def _get_connector(credentials: Any = None) -> Any:
     return _connector
 
 
+@lru_cache(maxsize=4)
+def _load_credentials(path: str) -> Any:
+    """Load and cache GCP service account credentials from a JSON key file.
+
+    Avoids re-reading and re-parsing the key every time an engine is built.
+    """
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(path)
+
+
+# Connection pool sizing per backend: (pool_size, max_overflow).
+SQLITE_POOL_LIMITS = (20, 10)
+POSTGRESQL_POOL_LIMITS = (5, 10)
+
+
+def pool_capacity(config: DatabaseConfig) -> int:
+    """Return the most connections an engine for `config` will ever open."""
+    pool_size, max_overflow = SQLITE_POOL_LIMITS if config.db_type == "sqlite" else POSTGRESQL_POOL_LIMITS
+    return pool_size + max_overflow
+
+
+# Default rows per multi-row INSERT on PostgreSQL, which caps a statement at
+# 65535 bind parameters. SQLite inserts go through executemany() instead and
+# are not paged.
+POSTGRESQL_INSERT_PAGE_SIZE = 1000
+
+# How long a SQLite connection waits for another writer's lock.
+SQLITE_BUSY_TIMEOUT_MS = 30_000
+
+
 def create_sqlite_engine(db_path: Path) -> Engine:
     """Create a SQLite engine.
 
+    Every new connection is switched to WAL journaling with relaxed fsync and
+    a larger page cache, the usual setup for bulk-insert heavy workloads.
+
     Args:
         db_path: Path to the SQLite database file.
 
@@ -40,7 +77,41 @@ def create_sqlite_engine(db_path: Path) -> Engine:
         SQLAlchemy Engine connected to the SQLite database.
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    return create_engine(f"sqlite:///{db_path}", echo=False)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        # FastAPI runs sync endpoints in a threadpool, so pooled connections
+        # may be used from a different thread than the one that opened them.
+        connect_args={"check_same_thread": False},
+        # Sized for that threadpool: WAL lets readers run concurrently, so
+        # requests should not queue behind the default 5 + 10 connections.
+        poolclass=QueuePool,
+        pool_size=SQLITE_POOL_LIMITS[0],
+        max_overflow=SQLITE_POOL_LIMITS[1],
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        # pysqlite's own transaction handling is kept on purpose: reads run
+        # outside a transaction and BEGIN is only issued before the first
+        # write. An explicit deferred BEGIN would pin a read snapshot, and a
+        # read-then-write transaction (ingest) would then fail with
+        # "database is locked" instead of waiting when another writer
+        # commits first.
+        cursor = dbapi_connection.cursor()
+        # WAL + synchronous=NORMAL: readers no longer block the writer and a
+        # commit no longer fsyncs a rollback journal. A blocked writer waits
+        # for the lock rather than failing at once. Remaining PRAGMAs give a
+        # 64 MB page cache, in-memory temp tables and 256 MB of mmap I/O.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+    return engine
 
 
 def create_postgresql_engine(config: DatabaseConfig) -> Engine:
@@ -59,11 +130,7 @@ def create_postgresql_engine(config: DatabaseConfig) -> Engine:
     # Lazy import to avoid requiring GCP dependencies for SQLite usage
     credentials = None
     if config.gcp_credentials_path and config.gcp_credentials_path.exists():
-        from google.oauth2 import service_account
-
-        credentials = service_account.Credentials.from_service_account_file(
-            str(config.gcp_credentials_path)
-        )
+        credentials = _load_credentials(str(config.gcp_credentials_path))
 
     connector = _get_connector(credentials)
 
@@ -88,17 +155,22 @@ def create_postgresql_engine(config: DatabaseConfig) -> Engine:
         creator=getconn,
         echo=False,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=POSTGRESQL_POOL_LIMITS[0],
+        max_overflow=POSTGRESQL_POOL_LIMITS[1],
         pool_timeout=30,
         pool_recycle=1800,
         pool_pre_ping=True,
+        insertmanyvalues_page_size=config.insert_page_size or POSTGRESQL_INSERT_PAGE_SIZE,
     )
 
 
+@lru_cache(maxsize=1)
 def create_engine_from_config(config: DatabaseConfig) -> Engine:
     """Create a database engine based on configuration.
 
+    Memoized per configuration so repeated calls within a process share one
+    engine (and its connection pool) instead of opening a second pool.
+
     Args:
         config: Database configuration.
 
@@ -124,7 +196,18 @@ def init_db(engine: Engine) -> None:
     Note: This is primarily for development/testing.
     Production should use Alembic migrations.
 
+    Indexes added to the models after a table was first created are created
+    as well, so existing development databases pick them up.
+
     Args:
         engine: SQLAlchemy Engine to initialize.
     """
     SQLModel.metadata.create_all(engine)
+    # create_all() skips existing tables entirely, including their new indexes.
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        # Seed the single graph version row (the migration does the same).
+        if conn.execute(select(GraphVersion.id)).first() is None:
+            conn.execute(insert(GraphVersion).values(id=1, version=0))
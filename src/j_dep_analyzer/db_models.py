@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
@@ -24,11 +24,29 @@ class DependencyEdge(SQLModel, table=True):
         # Prevent duplicate edges when ingesting multiple POMs.
         # We keep scope/optional in the uniqueness key because Maven treats those
         # as meaningful dependency attributes.
+        # Its index also serves `WHERE from_gav = ?` lookups (leftmost prefix),
+        # so from_gav needs no index of its own.
         UniqueConstraint("from_gav", "to_gav", "scope", "optional", name="uq_dep_edge"),
+        # Covering index for reverse lookups ("who depends on X"): answers
+        # `WHERE to_gav = ?` -> `from_gav` from the index alone.
+        Index("ix_dep_to_from", "to_gav", "from_gav"),
+        # Scope filter lists on every page load run `SELECT DISTINCT scope`;
+        # this turns them into a scan of a small index instead of the table.
+        Index("ix_dep_scope", "scope"),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    from_gav: str = Field(index=True)
-    to_gav: str = Field(index=True)
+    from_gav: str
+    to_gav: str
     scope: Optional[str] = Field(default=None)
     optional: Optional[bool] = Field(default=None)
+
+
+class GraphVersion(SQLModel, table=True):
+    """Single-row counter bumped by every transaction that changes the graph.
+
+    Graph caches and ETags key on it, so checking for new data is one
+    primary-key read rather than aggregates over the data tables.
+    """
+    id: int = Field(default=1, primary_key=True)
+    version: int = Field(default=0)
@@ -1,45 +1,244 @@
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Set as AbstractSet
+from functools import lru_cache
 from typing import Any
 
-import networkx as nx
-
 from j_dep_analyzer.models import MavenProject
 
 
-def build_graph(projects: Iterable[MavenProject]) -> nx.DiGraph:
+# Bit per known scope, so merged edges carry one int instead of a set of strings.
+# "parent" is the pseudo-scope the parser uses for <parent> edges.
+_SCOPE_BITS: dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate(("compile", "import", "parent", "provided", "runtime", "system", "test"))
+}
+
+
+# Cytoscape class string per combination of root (1), highlight (2) and
+# aggregated (4), so nodes share a prebuilt string instead of joining a list.
+_NODE_CLASSES: tuple[str, ...] = tuple(
+    " ".join(name for name, bit in (("root", 1), ("highlight", 2), ("aggregated", 4)) if bits & bit)
+    for bits in range(8)
+)
+
+
+# Memoized `nodes_within_depth` results kept per graph.
+_NEIGHBORHOOD_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def _scope_names(mask: int) -> tuple[str, ...]:
+    """Return the scope names set in `mask`."""
+    return tuple(name for name, bit in _SCOPE_BITS.items() if mask & bit)
+
+
+class DepGraph:
+    """Minimal directed graph covering what the dependency views need.
+
+    A -> B means A depends on B. Adjacency is kept as plain successor and
+    predecessor lists per node, so traversals iterate lists instead of
+    networkx's dict-of-dict-of-dict, and each edge costs one attribute dict.
+
+    Attributes:
+        nodes: Node id -> attribute dict (`g.nodes[n]["merged_count"]`).
+        edges: `(u, v)` -> attribute dict (`g.edges[u, v]["scope"]`).
+        succ: Node id -> successor ids, in insertion order.
+        pred: Node id -> predecessor ids, in insertion order.
+
+    Ancestor sets are memoized per node until the next new edge, since the
+    reverse view asks for them more than once per request. So are the
+    `nodes_within_depth` neighborhoods, which the UI re-requests for the same
+    root while toggling other view options.
+    """
+
+    __slots__ = ("nodes", "edges", "succ", "pred", "_ancestors", "_neighborhoods")
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, dict[str, Any]] = {}
+        self.edges: dict[tuple[str, str], dict[str, Any]] = {}
+        self.succ: dict[str, list[str]] = {}
+        self.pred: dict[str, list[str]] = {}
+        self._ancestors: dict[str, frozenset[str]] = {}
+        self._neighborhoods: dict[tuple[str, str, int | None], frozenset[str]] = {}
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_node(self, node: str, **attr: Any) -> None:
+        """Add `node`, or update its attributes if it already exists."""
+        data = self.nodes.get(node)
+        if data is None:
+            self.nodes[node] = attr
+            self.succ[node] = []
+            self.pred[node] = []
+        elif attr:
+            data.update(attr)
+
+    def add_edge(self, u: str, v: str, **attr: Any) -> None:
+        """Add edge `u -> v` (creating missing nodes), or update its attributes."""
+        data = self.edges.get((u, v))
+        if data is not None:
+            data.update(attr)
+            return
+        if u not in self.nodes:
+            self.add_node(u)
+        if v not in self.nodes:
+            self.add_node(v)
+        self.edges[(u, v)] = attr
+        self.succ[u].append(v)
+        self.pred[v].append(u)
+        # A new edge can extend any reachability set.
+        self._ancestors.clear()
+        self._neighborhoods.clear()
+
+    def add_nodes_from(self, nodes: Iterable[str]) -> None:
+        """Add every node in `nodes` (without attributes); existing ones are kept."""
+        for node in nodes:
+            if node not in self.nodes:
+                self.nodes[node] = {}
+                self.succ[node] = []
+                self.pred[node] = []
+
+    def add_edges_from(self, edges: Iterable[tuple[str, str, dict[str, Any]]]) -> None:
+        """Add `(u, v, attrs)` edges in bulk; same semantics as repeated `add_edge`.
+
+        Attribute dicts are stored as given (not copied) for new edges.
+        """
+        nodes, all_edges, succ, pred = self.nodes, self.edges, self.succ, self.pred
+        added = False
+        for u, v, attr in edges:
+            data = all_edges.get((u, v))
+            if data is not None:
+                data.update(attr)
+                continue
+            for node in (u, v):
+                if node not in nodes:
+                    nodes[node] = {}
+                    succ[node] = []
+                    pred[node] = []
+            all_edges[(u, v)] = attr
+            succ[u].append(v)
+            pred[v].append(u)
+            added = True
+        if added:
+            self._ancestors.clear()
+            self._neighborhoods.clear()
+
+    def has_node(self, node: str) -> bool:
+        return node in self.nodes
+
+    def has_edge(self, u: str, v: str) -> bool:
+        return (u, v) in self.edges
+
+    def successors(self, node: str) -> list[str]:
+        return self.succ[node]
+
+    def predecessors(self, node: str) -> list[str]:
+        return self.pred[node]
+
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self.edges)
+
+    def _reachable(
+        self, source: str, adj: dict[str, list[str]], within: AbstractSet[str] | None = None
+    ) -> set[str]:
+        # Iterative DFS; the source itself is excluded, even on a cycle.
+        seen: set[str] = set()
+        stack = [source]
+        while stack:
+            for nb in adj[stack.pop()]:
+                if nb not in seen and (within is None or nb in within):
+                    seen.add(nb)
+                    stack.append(nb)
+        seen.discard(source)
+        return seen
+
+    def ancestors(self, node: str, *, within: AbstractSet[str] | None = None) -> frozenset[str]:
+        """Return all nodes that can reach `node` (its transitive dependents).
+
+        Args:
+            node: Target node.
+            within: Only follow paths through these nodes, as if computed on
+                the subgraph induced by `within`.
+        """
+        cached = self._ancestors.get(node)
+        if within is None:
+            if cached is None:
+                cached = self._ancestors[node] = frozenset(self._reachable(node, self.pred))
+            return cached
+        if cached is not None and cached <= within:
+            return cached
+        return frozenset(self._reachable(node, self.pred, within))
+
+    def descendants(self, node: str) -> set[str]:
+        """Return all nodes reachable from `node` (its transitive dependencies)."""
+        return self._reachable(node, self.succ)
+
+    def subgraph(self, keep: Iterable[str]) -> DepGraph:
+        """Return an independent copy induced on the nodes in `keep`."""
+        keep_set = {n for n in keep if n in self.nodes}
+        out = DepGraph()
+        for node, data in self.nodes.items():
+            if node in keep_set:
+                out.add_node(node, **data)
+        for (u, v), data in self.edges.items():
+            if u in keep_set and v in keep_set:
+                out.add_edge(u, v, **data)
+        # Every node on a path to `node` is itself an ancestor of `node`, so
+        # an ancestor set lying entirely inside `keep` is still exact here.
+        for node, anc in self._ancestors.items():
+            if node in keep_set and anc <= keep_set:
+                out._ancestors[node] = anc
+        return out
+
+
+def build_graph(projects: Iterable[MavenProject]) -> DepGraph:
     """Build a directed graph where A -> B means A depends on B."""
-    g = nx.DiGraph()
+    nodes: list[str] = []
+    edges: list[tuple[str, str, dict[str, Any]]] = []
     for proj in projects:
         a = proj.project.compact()
-        g.add_node(a)
+        nodes.append(a)
         for dep in proj.dependencies:
-            b = dep.gav.compact()
-            g.add_node(b)
-            g.add_edge(a, b, scope=dep.scope, optional=dep.optional)
+            edges.append((a, dep.gav.compact(), {"scope": dep.scope, "optional": dep.optional}))
+    # Bulk inserts: one pass each instead of a method call per node and edge.
+    g = DepGraph()
+    g.add_nodes_from(nodes)
+    g.add_edges_from(edges)
     return g
 
 
-def reverse_dependencies(g: nx.DiGraph, target_gav: str) -> list[str]:
+def reverse_dependencies(g: DepGraph, target_gav: str) -> list[str]:
     """Return predecessors of target_gav (who depends on it)."""
     if target_gav not in g:
         return []
     return sorted(list(g.predecessors(target_gav)))
 
 
+@lru_cache(maxsize=100_000)
 def _split_gav(gav: str) -> tuple[str, str, str]:
-    parts = (gav or "").split(":")
-    if len(parts) >= 3:
+    """Split a GAV string into (group, artifact, version).
+
+    Partial ids are padded with "Unknown" so the UI stays resilient. Memoized:
+    the same GAVs are split again on every graph build/request.
+    """
+    parts = (gav or "").split(":", 3)
+    n = len(parts)
+    if n >= 3:
         return parts[0] or "Unknown", parts[1] or "Unknown", parts[2] or "Unknown"
-    if len(parts) == 2:
+    if n == 2:
         return parts[0] or "Unknown", parts[1] or "Unknown", "Unknown"
-    if len(parts) == 1:
-        return "Unknown", parts[0] or "Unknown", "Unknown"
-    return "Unknown", "Unknown", "Unknown"
+    return "Unknown", parts[0] or "Unknown", "Unknown"
 
 
+@lru_cache(maxsize=100_000)
 def aggregated_node_id(gav: str, *, show_group: bool, show_version: bool) -> str:
     """Map an atomic `group:artifact:version` id to an aggregated node id.
 
@@ -52,6 +251,7 @@ def aggregated_node_id(gav: str, *, show_group: bool, show_version: bool) -> str
     Newcomer note:
         The returned string becomes the node ID used by Cytoscape.js.
         If two atomic nodes map to the same ID, they become one merged node.
+        Results are memoized per `(gav, show_group, show_version)`.
     """
     group_id, artifact_id, version = _split_gav(gav)
     if show_group and show_version:
@@ -63,7 +263,29 @@ def aggregated_node_id(gav: str, *, show_group: bool, show_version: bool) -> str
     return artifact_id
 
 
-def aggregate_graph(g: nx.DiGraph, *, show_group: bool, show_version: bool) -> nx.DiGraph:
+def _copy_unaggregated(g: DepGraph) -> DepGraph | None:
+    """Fast path of `aggregate_graph` when both toggles are on.
+
+    Every full `group:artifact:version` id maps to itself, so nothing merges:
+    nodes and edges are copied once with their output attributes, skipping
+    the id mapping and scope-mask bookkeeping.
+
+    Returns:
+        The copied graph, or None if some node id is not a full GAV (it would
+        be rewritten, e.g. padded with "Unknown"), so the general path must run.
+    """
+    out = DepGraph()
+    for node_id in g.nodes:
+        if aggregated_node_id(node_id, show_group=True, show_version=True) != node_id:
+            return None
+        group_id, artifact_id, version = _split_gav(node_id)
+        out.add_node(node_id, group_id=group_id, artifact_id=artifact_id, version=version, merged_count=1)
+    for (u, v), data in g.edges.items():
+        out.add_edge(u, v, scope=data.get("scope") or "compile", optional_any=bool(data.get("optional")))
+    return out
+
+
+def aggregate_graph(g: DepGraph, *, show_group: bool, show_version: bool) -> DepGraph:
     """Aggregate nodes by toggles; merge edges while preserving scope metadata.
 
     What "aggregate" means here:
@@ -72,62 +294,82 @@ def aggregate_graph(g: nx.DiGraph, *, show_group: bool, show_version: bool) -> n
 
     Metadata handling:
         - Node: `merged_count` counts how many atomic nodes ended up in this node.
-        - Edge: when multiple edges collapse, scopes are combined into a comma list.
+        - Edge: when multiple edges collapse, scopes are combined into a comma list
+          (tracked as a bitmask over Maven's scope vocabulary while merging).
     """
-    out = nx.DiGraph()
-
-    def ensure_node(node_id: str) -> None:
-        if out.has_node(node_id):
-            return
-        group_id, artifact_id, version = _split_gav(
-            node_id if node_id.count(":") >= 2 else f"Unknown:{node_id}:Unknown"
-        )
+    if show_group and show_version:
+        identity = _copy_unaggregated(g)
+        if identity is not None:
+            return identity
+
+    out = DepGraph()
+
+    # Resolve every atomic node to its aggregated id exactly once; the edge
+    # loop below reuses this mapping instead of re-splitting GAV strings.
+    mapping = {
+        node_id: aggregated_node_id(str(node_id), show_group=show_group, show_version=show_version)
+        for node_id in g.nodes
+    }
+
+    for node_id, new_id in mapping.items():
+        merged = out.nodes.get(new_id)
+        if merged is not None:
+            # How many original nodes were merged into this aggregated node.
+            merged["merged_count"] += 1
+            continue
+        # Derive attributes from the atomic GAV; parts hidden by the toggles
+        # are reported as "Unknown".
+        group_id, artifact_id, version = _split_gav(str(node_id))
+        if not show_group:
+            group_id = "Unknown"
+        if not show_version:
+            version = "Unknown"
         out.add_node(
-            node_id,
+            new_id,
             group_id=group_id,
             artifact_id=artifact_id,
             version=version,
-            merged_count=0,
+            merged_count=1,
         )
 
-    for node_id in g.nodes:
-        new_id = aggregated_node_id(str(node_id), show_group=show_group, show_version=show_version)
-        ensure_node(new_id)
-        # How many original nodes were merged into this aggregated node.
-        out.nodes[new_id]["merged_count"] += 1
-
-    for u, v, data in g.edges(data=True):
-        uu = aggregated_node_id(str(u), show_group=show_group, show_version=show_version)
-        vv = aggregated_node_id(str(v), show_group=show_group, show_version=show_version)
-        ensure_node(uu)
-        ensure_node(vv)
+    # Every aggregated node exists now, so edges can be added directly.
+    for (u, v), data in g.edges.items():
+        uu = mapping[u]
+        vv = mapping[v]
 
-        scope = (data or {}).get("scope") or "compile"
-        optional = (data or {}).get("optional")
+        scope = data.get("scope") or "compile"
+        optional = data.get("optional")
 
-        if out.has_edge(uu, vv):
+        bit = _SCOPE_BITS.get(scope, 0)
+        attrs = out.edges.get((uu, vv))
+        if attrs is not None:
             # Merge edge metadata for collapsed edges (same uu -> vv after aggregation).
-            scopes = out.edges[uu, vv].get("_scopes", set())
-            scopes.add(scope)
-            out.edges[uu, vv]["_scopes"] = scopes
-            out.edges[uu, vv]["optional_any"] = bool(out.edges[uu, vv].get("optional_any")) or bool(optional)
+            attrs["_scope_mask"] |= bit
+            attrs["optional_any"] = attrs["optional_any"] or bool(optional)
         else:
-            out.add_edge(uu, vv, _scopes={scope}, optional_any=bool(optional))
-
-    for uu, vv in out.edges:
-        scopes = out.edges[uu, vv].get("_scopes", set())
-        out.edges[uu, vv]["scope"] = ", ".join(sorted(scopes)) if scopes else "compile"
+            out.add_edge(uu, vv, _scope_mask=bit, optional_any=bool(optional))
+            attrs = out.edges[uu, vv]
+        if not bit:
+            # Non-standard scope: rare, so only these edges pay for a set.
+            attrs.setdefault("_extra_scopes", set()).add(scope)
+
+    for attrs in out.edges.values():
+        names = _scope_names(attrs["_scope_mask"])
+        extra = attrs.get("_extra_scopes")
+        if extra:
+            names = tuple(sorted({*names, *extra}))
+        attrs["scope"] = ", ".join(names)
 
     return out
 
 
 def nodes_within_depth(
-    g: nx.DiGraph,
+    g: DepGraph,
     root: str,
     *,
     direction: str,
     depth: int | None,
-) -> set[str]:
+) -> frozenset[str]:
     """Return nodes within BFS depth from root.
 
     direction:
@@ -139,40 +381,80 @@ def nodes_within_depth(
     Newcomer note:
       This is a standard BFS (breadth-first search). We use it to avoid returning
       a huge graph when users only want "1 layer" or "2 layers" around a node.
+      It runs level by level: each step expands the whole current frontier
+      into the next one with set operations, so no per-node depth is tracked.
+
+    Results are memoized on `g` until its next new edge.
     """
     if not root or not g.has_node(root):
-        return set(g.nodes)
+        return frozenset(g.nodes)
+
+    key = (root, direction, depth)
+    cached = g._neighborhoods.get(key)
+    if cached is not None:
+        return cached
 
     if depth is None:
         if direction == "reverse":
-            return {root, *nx.ancestors(g, root)}
-        return {root, *nx.descendants(g, root)}
-
-    q: deque[tuple[str, int]] = deque([(root, 0)])
-    seen: set[str] = {root}
-
-    while q:
-        node, dist = q.popleft()
-        if dist >= depth:
-            continue
-
-        nbrs = g.predecessors(node) if direction == "reverse" else g.successors(node)
-        for nb in nbrs:
-            nb_str = str(nb)
-            if nb_str in seen:
-                continue
-            seen.add(nb_str)
-            q.append((nb_str, dist + 1))
-
-    return seen
+            seen = {root, *g.ancestors(root)}
+        else:
+            seen = {root, *g.descendants(root)}
+    else:
+        adj = g.pred if direction == "reverse" else g.succ
+        seen = {root}
+        frontier: set[str] = {root}
+        for _ in range(depth):
+            nxt: set[str] = set()
+            for node in frontier:
+                nxt.update(adj[node])
+            nxt -= seen
+            if not nxt:
+                break
+            seen |= nxt
+            frontier = nxt
+
+    if len(g._neighborhoods) >= _NEIGHBORHOOD_CACHE_SIZE:
+        # Crude bound; clearing is safe while other requests read the cache.
+        g._neighborhoods.clear()
+    result = g._neighborhoods[key] = frozenset(seen)
+    return result
+
+
+def _cytoscape_items(
+    g: DepGraph,
+    *,
+    root_id: str | None,
+    direction: str,
+    nodes: AbstractSet[str] | None,
+) -> tuple[
+    Collection[tuple[str, dict[str, Any]]],
+    Collection[tuple[tuple[str, str], dict[str, Any]]],
+    frozenset[str],
+]:
+    """Return the node items, edge items and highlight set to render."""
+    node_items: Collection[tuple[str, dict[str, Any]]]
+    edge_items: Collection[tuple[tuple[str, str], dict[str, Any]]]
+    if nodes is None:
+        node_items, edge_items = g.nodes.items(), g.edges.items()
+    else:
+        kept = sorted(n for n in nodes if n in g.nodes)
+        node_items = [(n, g.nodes[n]) for n in kept]
+        edge_items = [((u, v), g.edges[u, v]) for u in kept for v in g.succ[u] if v in nodes]
+
+    highlight: frozenset[str] = frozenset()
+    if root_id and g.has_node(root_id) and direction == "reverse":
+        # In reverse mode, highlight all ancestors (i.e. who depends on root).
+        highlight = g.ancestors(root_id, within=nodes)
+    return node_items, edge_items, highlight
 
 
 def graph_to_cytoscape_elements(
-    g: nx.DiGraph,
+    g: DepGraph,
     *,
     root_id: str | None = None,
     direction: str = "forward",
     show_version: bool = True,
+    nodes: AbstractSet[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Convert graph to Cytoscape.js `elements` format.
 
@@ -184,55 +466,125 @@ def graph_to_cytoscape_elements(
         - root: selected node
         - highlight: in reverse view, nodes that depend on the root
         - aggregated: version-hidden nodes
-    """
-    highlight: set[str] = set()
-    if root_id and g.has_node(root_id) and direction == "reverse":
-        # In reverse mode, highlight all ancestors (i.e. who depends on root).
-        highlight = {str(n) for n in nx.ancestors(g, root_id)}
 
-    elements: list[dict[str, Any]] = []
-
-    for node_id, data in g.nodes(data=True):
-        node_str = str(node_id)
-        label = node_str
-        if not show_version:
-            label = (data or {}).get("artifact_id") or _split_gav(node_str)[1] or node_str
-
-        classes: list[str] = []
-        if root_id and node_str == root_id:
-            classes.append("root")
-        if node_str in highlight:
-            classes.append("highlight")
-        if not show_version:
-            classes.append("aggregated")
-
-        elements.append(
-            {
-                "data": {
-                    "id": node_str,
-                    "label": label,
-                    "group_id": (data or {}).get("group_id"),
-                    "artifact_id": (data or {}).get("artifact_id"),
-                    "version": (data or {}).get("version"),
-                    "merged_count": int((data or {}).get("merged_count") or 0),
-                },
-                "classes": " ".join(classes),
-            }
-        )
-
-    for u, v, data in g.edges(data=True):
-        u_str = str(u)
-        v_str = str(v)
-        elements.append(
-            {
-                "data": {
-                    "id": f"{u_str}__{v_str}",
-                    "source": u_str,
-                    "target": v_str,
-                    "scope": (data or {}).get("scope") or "compile",
-                    "optional": bool((data or {}).get("optional_any")),
-                }
+    `nodes` restricts the output to those nodes and the edges between them,
+    exactly as if `g.subgraph(nodes)` were converted, without copying `g`.
+    Restricted output is ordered by node id.
+    """
+    node_items, edge_items, highlight = _cytoscape_items(
+        g, root_id=root_id, direction=direction, nodes=nodes
+    )
+
+    # Fixed size: one element per node and per edge, filled by index.
+    elements: list[dict[str, Any]] = [None] * (len(node_items) + len(edge_items))  # type: ignore[list-item]
+    i = 0
+    aggregated_bit = 0 if show_version else 4
+
+    for node_id, data in node_items:
+        get = data.get
+        artifact_id = get("artifact_id")
+        # aggregate_graph stores artifact_id on its nodes; only other nodes
+        # (e.g. edge-only ones) need their id split.
+        label = node_id if show_version else (artifact_id or _split_gav(node_id)[1])
+
+        bits = aggregated_bit
+        if node_id == root_id:
+            bits |= 1
+        if node_id in highlight:
+            bits |= 2
+
+        elements[i] = {
+            "data": {
+                "id": node_id,
+                "label": label,
+                "group_id": get("group_id"),
+                "artifact_id": artifact_id,
+                "version": get("version"),
+                "merged_count": int(get("merged_count") or 0),
+            },
+            "classes": _NODE_CLASSES[bits],
+        }
+        i += 1
+
+    for (u, v), data in edge_items:
+        get = data.get
+        elements[i] = {
+            "data": {
+                "id": f"{u}__{v}",
+                "source": u,
+                "target": v,
+                "scope": get("scope") or "compile",
+                "optional": bool(get("optional_any")),
             }
-        )
+        }
+        i += 1
 
     return elements
+
+
+def graph_to_cytoscape_columns(
+    g: DepGraph,
+    *,
+    root_id: str | None = None,
+    direction: str = "forward",
+    show_version: bool = True,
+    nodes: AbstractSet[str] | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Columnar variant of `graph_to_cytoscape_elements` for large graphs.
+
+    Returns `{"nodes": {field: [...]}, "edges": {field: [...]}}` with one list
+    per element field, so a big payload carries each key once instead of once
+    per element and no per-element dicts are built. Node fields are the node
+    `data` fields plus `classes`; edge ids (`source__target`) are left to the
+    client. Row `i` of every list describes the same element.
+    """
+    node_items, edge_items, highlight = _cytoscape_items(
+        g, root_id=root_id, direction=direction, nodes=nodes
+    )
+    aggregated_bit = 0 if show_version else 4
+
+    ids: list[str] = []
+    labels: list[str] = []
+    group_ids: list[Any] = []
+    artifact_ids: list[Any] = []
+    versions: list[Any] = []
+    merged_counts: list[int] = []
+    classes: list[str] = []
+    for node_id, data in node_items:
+        get = data.get
+        artifact_id = get("artifact_id")
+        bits = aggregated_bit
+        if node_id == root_id:
+            bits |= 1
+        if node_id in highlight:
+            bits |= 2
+        ids.append(node_id)
+        labels.append(node_id if show_version else (artifact_id or _split_gav(node_id)[1]))
+        group_ids.append(get("group_id"))
+        artifact_ids.append(artifact_id)
+        versions.append(get("version"))
+        merged_counts.append(int(get("merged_count") or 0))
+        classes.append(_NODE_CLASSES[bits])
+
+    sources: list[str] = []
+    targets: list[str] = []
+    scopes: list[str] = []
+    optional: list[bool] = []
+    for (u, v), data in edge_items:
+        sources.append(u)
+        targets.append(v)
+        scopes.append(data.get("scope") or "compile")
+        optional.append(bool(data.get("optional_any")))
+
+    return {
+        "nodes": {
+            "id": ids,
+            "label": labels,
+            "group_id": group_ids,
+            "artifact_id": artifact_ids,
+            "version": versions,
+            "merged_count": merged_counts,
+            "classes": classes,
+        },
+        "edges": {"source": sources, "target": targets, "scope": scopes, "optional": optional},
+    }
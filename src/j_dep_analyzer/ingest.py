@@ -0,0 +1,157 @@
+"""Persist parsed Maven projects into the database."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import sqlite
+from sqlmodel import Session, SQLModel, select
+
+from j_dep_analyzer.db_models import Artifact, DependencyEdge, GraphVersion
+from j_dep_analyzer.models import MavenProject
+
+
+# Keys per `IN (...)` existence query; stays well below SQLite's and
+# PostgreSQL's bind-parameter limits.
+_IN_CHUNK_SIZE = 500
+
+
+def _chunks(items: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _insert_ignore(session: Session, model: type[SQLModel], rows: list[dict[str, Any]]) -> None:
+    """Insert rows in one statement, silently skipping rows that already exist.
+
+    Uses the dialect-specific `INSERT ... ON CONFLICT DO NOTHING` so a
+    concurrent upload of the same POM cannot fail the whole batch. Statements
+    target the Core `Table` and run on the session's connection: nothing is
+    read back, so the ORM unit of work and identity map are bypassed.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    conn = session.connection()
+    if conn.dialect.name == "postgresql":
+        # Lazy import: SQLite deployments never load the PostgreSQL dialect.
+        from sqlalchemy.dialects import postgresql
+
+        # pg8000 (the only sync driver the CloudSQL connector supports) runs
+        # executemany() as one round trip per row, so send explicit multi-row
+        # VALUES statements instead.
+        # Page size comes from the engine's `insertmanyvalues_page_size`.
+        page_size = conn.dialect.insertmanyvalues_page_size
+        for start in range(0, len(rows), page_size):
+            page = rows[start : start + page_size]
+            conn.execute(postgresql.insert(table).values(page).on_conflict_do_nothing())
+        return
+    # sqlite3's executemany() loops in C over a single prepared statement.
+    conn.execute(sqlite.insert(table).on_conflict_do_nothing(), rows)
+
+
+def bump_graph_version(session: Session) -> None:
+    """Mark the stored graph as changed, in the caller's transaction.
+
+    Anything that writes artifacts or edges outside `ingest_projects` must
+    call this before committing, or cached graphs keep being served. On
+    PostgreSQL the row lock orders concurrent writers, so every commit is
+    visible under its own version.
+    """
+    conn = session.connection()
+    result = conn.execute(update(GraphVersion).where(GraphVersion.id == 1).values(version=GraphVersion.version + 1))
+    if result.rowcount == 0:
+        # Databases created before the counter existed and not yet migrated.
+        conn.execute(insert(GraphVersion).values(id=1, version=1))
+
+
+def ingest_projects(
+    session: Session,
+    projects: Iterable[MavenProject],
+    *,
+    scopes: Iterable[str] | None = None,
+) -> tuple[int, int]:
+    """Store artifacts and dependency edges for the given projects.
+
+    All rows are collected in memory first, checked against the database
+    with batched `IN (...)` lookups, and the new ones written with one bulk
+    INSERT per table, and the graph version is bumped when anything was
+    new; the caller owns the transaction and must commit.
+
+    Args:
+        session: Open database session.
+        projects: Parsed Maven projects; may be a lazy iterator.
+        scopes: Optional set of scopes to keep (missing scope counts as
+            "compile"). Dependencies in other scopes are not stored at all,
+            e.g. `{"compile", "runtime"}` drops test-only edges. None keeps all.
+
+    Returns:
+        A `(ingested_projects, ingested_edges)` tuple, where `ingested_edges`
+        counts only edges that were not stored before.
+    """
+    scopes_norm = {sc.strip().lower() for sc in (scopes or []) if (sc or "").strip()}
+
+    project_count = 0
+    project_gavs: set[str] = set()
+    # Candidate rows keyed by their identity, de-duplicated within the batch.
+    artifacts: dict[str, dict[str, Any]] = {}
+    edges: dict[tuple[str, str, str, bool | None], dict[str, Any]] = {}
+
+    for proj in projects:
+        project_count += 1
+        a = proj.project
+        a_gav = a.compact()
+        project_gavs.add(a_gav)
+        if a_gav not in artifacts:
+            artifacts[a_gav] = {
+                "gav": a_gav, "group_id": a.group_id, "artifact_id": a.artifact_id, "version": a.version
+            }
+
+        for dep in proj.dependencies:
+            scope = dep.scope or "compile"
+            if scopes_norm and scope.lower() not in scopes_norm:
+                continue
+
+            b = dep.gav
+            b_gav = b.compact()
+            if b_gav not in artifacts:
+                artifacts[b_gav] = {
+                    "gav": b_gav, "group_id": b.group_id, "artifact_id": b.artifact_id, "version": b.version
+                }
+
+            key = (a_gav, b_gav, scope, dep.optional)
+            if key not in edges:
+                edges[key] = {"from_gav": a_gav, "to_gav": b_gav, "scope": scope, "optional": dep.optional}
+
+    # Existence checks touch only the keys in this batch, a few IN-list
+    # queries in total, rather than reading whole tables.
+    for chunk in _chunks(list(artifacts), _IN_CHUNK_SIZE):
+        for gav in session.exec(select(Artifact.gav).where(Artifact.gav.in_(chunk))):
+            artifacts.pop(gav, None)
+    # Every new edge starts at an uploaded project, so only their outgoing
+    # edges can collide. NULL `optional` values never collide on the unique
+    # constraint, so duplicates must be filtered here rather than left to
+    # ON CONFLICT. Plain column tuples: no ORM instances are hydrated.
+    for chunk in _chunks(list(project_gavs), _IN_CHUNK_SIZE):
+        rows = session.exec(
+            select(
+                DependencyEdge.from_gav,
+                DependencyEdge.to_gav,
+                DependencyEdge.scope,
+                DependencyEdge.optional,
+            ).where(DependencyEdge.from_gav.in_(chunk))
+        )
+        for from_gav, to_gav, scope, optional in rows:
+            edges.pop((from_gav, to_gav, scope or "compile", optional), None)
+
+    artifact_rows = list(artifacts.values())
+    edge_rows = list(edges.values())
+    _insert_ignore(session, Artifact, artifact_rows)
+    _insert_ignore(session, DependencyEdge, edge_rows)
+    if artifact_rows or edge_rows:
+        # Last, so the counter row stays locked only until the commit.
+        bump_graph_version(session)
+
+    return project_count, len(edge_rows)
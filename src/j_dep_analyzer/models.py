@@ -1,30 +1,58 @@
-"""Pydantic models for Maven artifacts and dependencies."""
+"""Data models for Maven artifacts and dependencies."""
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import sys
+from dataclasses import dataclass, field
+
+from j_dep_analyzer.exceptions import PomModelError
 
 
 UNKNOWN_VERSION = "Unknown"
 
 
-class GAV(BaseModel):
-    """Maven coordinates (GroupId, ArtifactId, Version)."""
+@dataclass(slots=True, frozen=True)
+class GAV:
+    """Maven coordinates (GroupId, ArtifactId, Version).
+
+    Slotted, immutable and hashable; one is allocated per parsed project and
+    per dependency, so these stay as small as possible. Coordinate strings are
+    interned: the same dependency shows up in many POMs, and interning lets all
+    of those GAVs share one copy of each string.
+
+    Raises:
+        PomModelError: If any coordinate is empty.
+    """
 
-    group_id: str = Field(..., min_length=1)
-    artifact_id: str = Field(..., min_length=1)
-    version: str = Field(default=UNKNOWN_VERSION, min_length=1)
+    group_id: str
+    artifact_id: str
+    version: str = UNKNOWN_VERSION
+    _compact: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in ("group_id", "artifact_id", "version"):
+            value = getattr(self, name)
+            if not value:
+                raise PomModelError(f"GAV {name} must be a non-empty string")
+            object.__setattr__(self, name, sys.intern(value))
+        object.__setattr__(
+            self, "_compact", sys.intern(f"{self.group_id}:{self.artifact_id}:{self.version}")
+        )
 
     def compact(self) -> str:
         """Return a compact string representation.
 
+        The string is built once at construction, since ingest and graph
+        building ask for it repeatedly.
+
         Returns:
             A string like `groupId:artifactId:version`.
         """
-        return f"{self.group_id}:{self.artifact_id}:{self.version}"
+        return self._compact
 
 
-class Dependency(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Dependency:
     """A Maven dependency entry."""
 
     gav: GAV
@@ -45,8 +73,9 @@ class Dependency(BaseModel):
         return " ".join(parts)
 
 
-class MavenProject(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MavenProject:
     """A parsed Maven project model."""
 
     project: GAV
-    dependencies: list[Dependency] = Field(default_factory=list)
+    dependencies: list[Dependency] = field(default_factory=list)
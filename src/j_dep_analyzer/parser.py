@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import re
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import Executor, Future
+from itertools import chain, islice
 from pathlib import Path
 from typing import Mapping
 
@@ -14,28 +20,72 @@ from j_dep_analyzer.models import Dependency, GAV, MavenProject, UNKNOWN_VERSION
 
 _PLACEHOLDER_RE = re.compile(r"\$\{([^}]+)\}")
 
-
-def _text_first(node: etree._Element, xpath_expr: str) -> str | None:
-    """Get text of the first matching element using namespace-agnostic XPath.
+# Maven's scope vocabulary; mapping to these constants makes every parsed
+# scope share one string object.
+_SCOPES: dict[str, str] = {
+    s: s for s in ("compile", "provided", "runtime", "test", "system", "import")
+}
+
+# Child elements read from <project>/<parent> and from each <dependency>.
+_COORD_FIELDS = frozenset({"groupId", "artifactId", "version"})
+_DEP_FIELDS = frozenset({"groupId", "artifactId", "version", "scope", "optional"})
+
+# Shared by every parse in the process; lxml serializes concurrent use of one
+# parser, and each parse is a fraction of a millisecond. Indentation,
+# comments and PIs are never read, so they are not created; entities and
+# network access stay disabled.
+_XML_PARSER = etree.XMLParser(
+    resolve_entities=False,
+    no_network=True,
+    huge_tree=False,
+    collect_ids=False,
+    remove_blank_text=True,
+    remove_comments=True,
+    remove_pis=True,
+)
+
+# Below this many files, process pool start-up costs more than it saves.
+_PARALLEL_THRESHOLD = 8
+# Paths sent to a worker per task when the total is unknown (lazy input).
+_POOL_CHUNKSIZE = 8
+# For sized input, aim for this many tasks per worker: big enough chunks to
+# amortize IPC, enough of them to keep workers balanced near the end.
+_TASKS_PER_WORKER = 4
+# Chunks per worker submitted but not yet consumed; bounds parse_poms' memory.
+_INFLIGHT_PER_WORKER = 2
+
+
+def _child_texts(node: etree._Element, names: frozenset[str]) -> dict[str, str | None]:
+    """Collect the text of selected direct children in one pass.
+
+    Matching is on the local name, so it works with or without XML namespaces.
+    Only the first occurrence of each name counts, mirroring what a
+    `local-name()` XPath lookup returned for its first hit.
 
     Args:
-        node: Root element to query under.
-        xpath_expr: XPath expression (should use local-name()).
+        node: Element whose children are scanned.
+        names: Local names to collect.
 
     Returns:
-        Text content if found and non-empty, otherwise None.
+        Mapping of found local name to its stripped text, or None when empty.
+    """
+    fields: dict[str, str | None] = {}
+    for child in node.iterchildren(tag=etree.Element):
+        ln = etree.QName(child).localname
+        if ln in names and ln not in fields:
+            fields[ln] = (child.text or "").strip() or None
+    return fields
+
+
+def _canon(value: str | None) -> str | None:
+    """Return a shared (interned) instance of a frequently repeated string.
+
+    Scopes and groupIds repeat across nearly every dependency of every POM;
+    interning them keeps one copy in memory and makes dict keying cheaper.
     """
-    found = node.xpath(xpath_expr)
-    if not found:
+    if value is None:
         return None
-    first = found[0]
-    if isinstance(first, etree._Element):
-        text = (first.text or "").strip()
-        return text or None
-    if isinstance(first, str):
-        text = first.strip()
-        return text or None
-    return None
+    return _SCOPES.get(value) or sys.intern(value)
 
 
 def _bool_text(value: str | None) -> bool | None:
@@ -60,6 +110,11 @@ def _bool_text(value: str | None) -> bool | None:
 def _parse_xml(path: Path) -> etree._Element:
     """Parse an XML file and return its root element.
 
+    The file is read with one `read_bytes()` call and parsed from memory by a
+    shared module-level parser, avoiding libxml2's incremental file I/O and
+    any per-element Python callbacks. POMs are small, and parse_pom only
+    visits the sections it needs, so the whole tree is kept.
+
     Args:
         path: Path to the pom.xml file.
 
@@ -70,39 +125,37 @@ def _parse_xml(path: Path) -> etree._Element:
     Returns:
         Root XML element.
     """
-    if not path.exists():
-        raise PomNotFoundError(f"pom.xml not found: {path}")
     try:
-        parser = etree.XMLParser(resolve_entities=False, no_network=True, recover=False)
-        tree = etree.parse(str(path), parser=parser)
-        return tree.getroot()
-    except (OSError, etree.XMLSyntaxError) as exc:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        raise PomNotFoundError(f"pom.xml not found: {path}") from None
+    except OSError as exc:
+        raise PomParseError(f"Failed to parse pom.xml: {path}") from exc
+    try:
+        return etree.fromstring(data, parser=_XML_PARSER)
+    except etree.XMLSyntaxError as exc:
         raise PomParseError(f"Failed to parse pom.xml: {path}") from exc
 
 
-def _resolve_placeholders(value: str, props: Mapping[str, str]) -> str:
+def _resolve_placeholders(value: str, props: Mapping[str, str], _seen: tuple[str, ...] = ()) -> str:
     """Resolve ${...} placeholders using provided properties.
 
+    Single pass: each placeholder is expanded recursively on demand, and a
+    property already being expanded is left as-is, so cycles terminate.
     Unknown placeholders are preserved as-is.
     """
-    current = value
-    for _ in range(5):
-        changed = False
-
-        def _sub(m: re.Match[str]) -> str:
-            nonlocal changed
-            key = m.group(1)
-            replacement = props.get(key)
-            if replacement:
-                changed = True
-                return replacement
+    if "${" not in value:
+        # Common case (literal versions/ids): skip the regex entirely.
+        return value
+
+    def _sub(m: re.Match[str]) -> str:
+        key = m.group(1)
+        replacement = props.get(key)
+        if not replacement or key in _seen:
             return m.group(0)
+        return _resolve_placeholders(replacement, props, (*_seen, key))
 
-        nxt = _PLACEHOLDER_RE.sub(_sub, current)
-        current = nxt
-        if not changed:
-            break
-    return current
+    return _PLACEHOLDER_RE.sub(_sub, value)
 
 
 def _normalize_version(value: str | None, props: Mapping[str, str]) -> str:
@@ -125,16 +178,17 @@ def _normalize_version(value: str | None, props: Mapping[str, str]) -> str:
     return resolved
 
 
-def _parse_properties(root: etree._Element) -> dict[str, str]:
+def _parse_properties(properties: etree._Element | None) -> dict[str, str]:
     props: dict[str, str] = {}
-    nodes = root.xpath("/*[local-name()='project']/*[local-name()='properties']/*")
-    for n in nodes:
-        if not isinstance(n, etree._Element):
-            continue
+    if properties is None:
+        return props
+    for n in properties.iterchildren(tag=etree.Element):
         key = etree.QName(n).localname
         val = (n.text or "").strip()
         if key and val:
-            props[key] = val
+            # Names like `spring.version` recur in every POM of a build, and
+            # their values usually do too; share one copy of each.
+            props[sys.intern(key)] = sys.intern(val)
     return props
 
 
@@ -142,7 +196,7 @@ def parse_pom(path: str | Path) -> MavenProject:
     """Parse a Maven pom.xml and extract direct dependencies.
 
     Notes:
-        - Namespace handling: uses `local-name()` XPath so it works with or without XML namespaces.
+        - Namespace handling: elements are matched by local name so it works with or without XML namespaces.
                 - Property placeholders like `${...}` are resolved when possible.
                     If a version cannot be resolved, it is stored as "Unknown".
 
@@ -150,30 +204,43 @@ def parse_pom(path: str | Path) -> MavenProject:
         path: Path to a pom.xml.
 
     Raises:
+        PomNotFoundError: If the file does not exist.
         PomModelError: If required fields are missing.
 
     Returns:
         A `MavenProject` containing project GAV and a list of dependencies.
     """
-    pom_path = Path(path)
-    root = _parse_xml(pom_path)
-
-    raw_group_id = _text_first(root, "/*[local-name()='project']/*[local-name()='groupId']")
-    raw_artifact_id = _text_first(root, "/*[local-name()='project']/*[local-name()='artifactId']")
-    raw_version = _text_first(root, "/*[local-name()='project']/*[local-name()='version']")
-
-    parent_group_id = _text_first(
-        root,
-        "/*[local-name()='project']/*[local-name()='parent']/*[local-name()='groupId']",
-    )
-    parent_artifact_id = _text_first(
-        root,
-        "/*[local-name()='project']/*[local-name()='parent']/*[local-name()='artifactId']",
-    )
-    parent_version = _text_first(
-        root,
-        "/*[local-name()='project']/*[local-name()='parent']/*[local-name()='version']",
-    )
+    root = _parse_xml(Path(path))
+
+    # Single scan over <project>'s children; sections are picked out by
+    # local name instead of one namespace-agnostic XPath walk per field.
+    project_fields: dict[str, str | None] = {}
+    parent_fields: dict[str, str | None] = {}
+    properties: etree._Element | None = None
+    dependencies: etree._Element | None = None
+    if etree.QName(root).localname == "project":
+        for child in root.iterchildren(tag=etree.Element):
+            ln = etree.QName(child).localname
+            if ln in _COORD_FIELDS:
+                if ln not in project_fields:
+                    project_fields[ln] = (child.text or "").strip() or None
+            elif ln == "parent":
+                if not parent_fields:
+                    parent_fields = _child_texts(child, _COORD_FIELDS)
+            elif ln == "properties":
+                if properties is None:
+                    properties = child
+            elif ln == "dependencies":
+                if dependencies is None:
+                    dependencies = child
+
+    raw_group_id = project_fields.get("groupId")
+    raw_artifact_id = project_fields.get("artifactId")
+    raw_version = project_fields.get("version")
+
+    parent_group_id = parent_fields.get("groupId")
+    parent_artifact_id = parent_fields.get("artifactId")
+    parent_version = parent_fields.get("version")
 
     if raw_artifact_id is None:
         raise PomModelError("Missing required <artifactId> in pom.xml")
@@ -184,7 +251,7 @@ def parse_pom(path: str | Path) -> MavenProject:
     if raw_group_id is None:
         raise PomModelError("Missing required <groupId> (or parent <groupId>) in pom.xml")
 
-    props = _parse_properties(root)
+    props = _parse_properties(properties)
     effective_version = raw_version or UNKNOWN_VERSION
     builtins: dict[str, str] = {
         "project.groupId": raw_group_id,
@@ -202,7 +269,7 @@ def parse_pom(path: str | Path) -> MavenProject:
     group_id = _resolve_placeholders(raw_group_id, merged_props)
     version = _normalize_version(effective_version, merged_props)
 
-    project_gav = GAV(group_id=group_id, artifact_id=raw_artifact_id, version=version)
+    project_gav = GAV(group_id=_canon(group_id), artifact_id=raw_artifact_id, version=version)
 
     deps: list[Dependency] = []
 
@@ -213,25 +280,24 @@ def parse_pom(path: str | Path) -> MavenProject:
         parent_artifact_resolved = _resolve_placeholders(parent_artifact_id, merged_props)
         parent_version_norm = _normalize_version(parent_version, merged_props)
         parent_gav = GAV(
-            group_id=parent_group_resolved,
+            group_id=_canon(parent_group_resolved),
             artifact_id=parent_artifact_resolved,
             version=parent_version_norm,
         )
         if parent_gav.compact() != project_gav.compact():
             deps.append(Dependency(gav=parent_gav, scope="parent", optional=None))
 
-    dep_nodes = root.xpath(
-        "/*[local-name()='project']"
-        "/*[local-name()='dependencies']"
-        "/*[local-name()='dependency']"
-    )
+    dep_nodes = dependencies.iterchildren(tag=etree.Element) if dependencies is not None else ()
 
     for dep in dep_nodes:
-        dep_group_id = _text_first(dep, "./*[local-name()='groupId']")
-        dep_artifact_id = _text_first(dep, "./*[local-name()='artifactId']")
-        dep_version = _text_first(dep, "./*[local-name()='version']")
-        dep_scope = _text_first(dep, "./*[local-name()='scope']")
-        dep_optional = _bool_text(_text_first(dep, "./*[local-name()='optional']"))
+        if etree.QName(dep).localname != "dependency":
+            continue
+        fields = _child_texts(dep, _DEP_FIELDS)
+        dep_group_id = fields.get("groupId")
+        dep_artifact_id = fields.get("artifactId")
+        dep_version = fields.get("version")
+        dep_scope = fields.get("scope")
+        dep_optional = _bool_text(fields.get("optional"))
 
         if dep_group_id is None or dep_artifact_id is None:
             continue
@@ -240,10 +306,101 @@ def parse_pom(path: str | Path) -> MavenProject:
 
         deps.append(
             Dependency(
-                gav=GAV(group_id=dep_group_id, artifact_id=dep_artifact_id, version=dep_version),
-                scope=dep_scope,
+                gav=GAV(group_id=_canon(dep_group_id), artifact_id=dep_artifact_id, version=dep_version),
+                scope=_canon(dep_scope),
                 optional=dep_optional,
             )
         )
 
     return MavenProject(project=project_gav, dependencies=deps)
+
+
+def _parse_pom_chunk(paths: list[str | Path]) -> list[MavenProject]:
+    # One pool task: several files per round trip to amortize IPC.
+    return [parse_pom(p) for p in paths]
+
+
+def parse_poms(
+    paths: Iterable[str | Path],
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> Iterator[MavenProject]:
+    """Parse many pom.xml files, spreading the XML work over a process pool.
+
+    Parsing is CPU-bound and independent per file, so larger batches are handed
+    to a `ProcessPoolExecutor` in chunks. Results are yielded in input order as
+    they complete, letting callers consume them without waiting for the whole
+    batch. `paths` is consumed lazily and at most `_INFLIGHT_PER_WORKER`
+    chunks per worker are queued or unconsumed at any time, so memory stays
+    bounded by that window rather than by the input size. When `paths` is a
+    sized collection, the chunk size is derived from its length and the
+    worker count.
+
+    Args:
+        paths: Paths to pom.xml files; any iterable.
+        max_workers: Pool size; defaults to the CPU count. Also sizes the
+            in-flight window when `executor` is given.
+        executor: Long-lived process pool to use instead of starting one for
+            this call; it is left running afterwards.
+
+    Raises:
+        JDepError: Re-raised from the first file that fails to parse.
+
+    Yields:
+        One `MavenProject` per input path.
+    """
+    it = iter(paths)
+    head = list(islice(it, _PARALLEL_THRESHOLD))
+    if len(head) < _PARALLEL_THRESHOLD:
+        for p in head:
+            yield parse_pom(p)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    if isinstance(paths, Sized):
+        chunksize = max(1, len(paths) // (workers * _TASKS_PER_WORKER))
+    else:
+        chunksize = _POOL_CHUNKSIZE
+    all_paths = chain(head, it)
+    chunks = iter(lambda: list(islice(all_paths, chunksize)), [])
+    window = workers * _INFLIGHT_PER_WORKER
+
+    if executor is not None:
+        yield from _map_bounded(executor, chunks, window)
+        return
+
+    # Lazy import: single-file callers don't pay for loading multiprocessing.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawned rather than forked: the caller may be multithreaded, and a forked
+    # worker could inherit a lock held by another thread.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+        yield from _map_bounded(ex, chunks, window)
+
+
+def _map_bounded(
+    executor: Executor,
+    chunks: Iterator[list[str | Path]],
+    window: int,
+) -> Iterator[MavenProject]:
+    """Run `_parse_pom_chunk` over `chunks`, keeping at most `window` in flight.
+
+    Unlike `Executor.map`, which submits every task up front, the next chunk
+    is only submitted once the oldest one has been consumed. Pending work is
+    cancelled if the caller stops early or a chunk fails.
+    """
+    pending: deque[Future[list[MavenProject]]] = deque(
+        executor.submit(_parse_pom_chunk, chunk) for chunk in islice(chunks, window)
+    )
+    try:
+        while pending:
+            projects = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_parse_pom_chunk, chunk))
+            yield from projects
+    finally:
+        for fut in pending:
+            fut.cancel()
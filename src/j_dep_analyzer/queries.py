@@ -0,0 +1,63 @@
+"""Graph questions answered directly in SQL.
+
+These avoid loading every `DependencyEdge` into an in-memory graph when only a
+small part of it is needed; the `to_gav`/`from_gav` indexes do the work.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlmodel import Session
+
+from j_dep_analyzer.db_models import DependencyEdge, GraphVersion
+
+
+def dependents_of(
+    session: Session,
+    target_gav: str,
+    *,
+    transitive: bool = False,
+    limit: int | None = None,
+) -> list[str]:
+    """Return the GAVs that depend on `target_gav`, sorted.
+
+    Args:
+        session: Open database session.
+        target_gav: The artifact whose dependents are wanted.
+        transitive: Follow dependents of dependents (recursive CTE) instead of
+            returning only direct predecessors.
+        limit: Optional cap on the number of returned GAVs.
+
+    Returns:
+        Sorted list of dependent GAVs, excluding `target_gav` itself.
+    """
+    if not transitive:
+        stmt = (
+            select(DependencyEdge.from_gav)
+            .where(DependencyEdge.to_gav == target_gav)
+            .distinct()
+            .order_by(DependencyEdge.from_gav)
+        )
+    else:
+        # UNION (not UNION ALL) de-duplicates, which also terminates on cycles.
+        rd = (
+            select(DependencyEdge.from_gav.label("gav"))
+            .where(DependencyEdge.to_gav == target_gav)
+            .cte("rd", recursive=True)
+        )
+        rd = rd.union(select(DependencyEdge.from_gav).join(rd, DependencyEdge.to_gav == rd.c.gav))
+        stmt = select(rd.c.gav).where(rd.c.gav != target_gav).distinct().order_by(rd.c.gav)
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return list(session.execute(stmt).scalars().all())
+
+
+def graph_version(session: Session) -> int:
+    """Return the stored graph's version counter (0 when it has none yet).
+
+    Bumped in every transaction that writes artifacts or edges, see
+    `j_dep_analyzer.ingest.bump_graph_version`.
+    """
+    version = session.execute(select(GraphVersion.version).where(GraphVersion.id == 1)).scalar()
+    return version or 0
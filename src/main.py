@@ -1,31 +1,50 @@
 from __future__ import annotations
 
+import csv
+import gzip
+import hashlib
+import io
+import multiprocessing
 import os
 import tempfile
-import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-import networkx as nx
-from fastapi import FastAPI, File, Query, Request, UploadFile
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+import anyio.to_thread
+import jinja2
+import orjson
+from fastapi import Depends, FastAPI, File, Query, Request, UploadFile
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import select as sa_select
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import case, distinct, func, literal, literal_column, or_, select as sa_select
+from sqlalchemy.orm import aliased
 from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 from sqlmodel import SQLModel
 
 from j_dep_analyzer.config import DatabaseConfig
-from j_dep_analyzer.db import create_engine_from_config, init_db
+from j_dep_analyzer.db import create_engine_from_config, init_db, pool_capacity
 from j_dep_analyzer.db_models import Artifact, DependencyEdge
 from j_dep_analyzer.graph import (
+    DepGraph,
+    _split_gav,
     aggregate_graph,
     aggregated_node_id,
+    graph_to_cytoscape_columns,
     graph_to_cytoscape_elements,
     nodes_within_depth,
 )
-from j_dep_analyzer.parser import parse_pom
+from j_dep_analyzer.ingest import ingest_projects
+from j_dep_analyzer.parser import parse_poms
+from j_dep_analyzer.queries import dependents_of, graph_version
 
 BASE_DIR = Path(__file__).resolve().parent
 PKG_DIR = BASE_DIR / "j_dep_analyzer"
@@ -43,7 +62,32 @@ DB_PATH = (
 )
 
 app = FastAPI(title="J-Dep Analyzer")
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered by orjson.
+
+    Endpoints return instances directly: returning a plain dict would make
+    FastAPI walk it through `jsonable_encoder` before rendering.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Templates only change on deploy (dev mode restarts on template edits), so
+# skip per-render mtime checks and keep compiled bytecode on disk for
+# other workers and later restarts. Jinja's default cache directory is
+# per-user, created 0700 and ownership-checked, so other local users
+# cannot plant bytecode in it.
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+)
 
 if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
@@ -51,16 +95,27 @@ if STATIC_DIR.exists():
 
 @app.on_event("startup")
 def _startup() -> None:
+    # Build the shared engine up front so the first request doesn't pay for
+    # connector/pool creation.
+    engine = _engine()
+    # Sync endpoints run in AnyIO's threadpool (40 threads by default). Threads
+    # beyond the DB pool's capacity would only block on connection checkout
+    # and fail after pool_timeout; cap the threadpool so excess requests wait
+    # for a thread instead.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = pool_capacity(db_config)
     # Note: In production, schema is managed by Alembic migrations.
     # init_db is kept for development convenience with SQLite.
     if db_config.db_type == "sqlite":
-        engine = _engine()
         init_db(engine)
+    # Compile every template now instead of on its first request.
+    for name in templates.env.list_templates():
+        templates.env.get_template(name)
 
 
 # Cached engine singleton to avoid creating new connections on every request.
 # CloudSQL Connector is expensive to create, so we reuse the same engine.
 _cached_engine: Engine | None = None
+_engine_lock = threading.Lock()
 
 
 def _engine() -> Engine:
@@ -68,40 +123,248 @@ def _engine() -> Engine:
 
     Returns a singleton engine instance to avoid connection overhead,
     especially important for CloudSQL where connector creation is expensive.
+    Concurrent first requests (threadpool workers) build it only once.
     """
     global _cached_engine
-    if _cached_engine is None:
-        _cached_engine = create_engine_from_config(db_config)
-    return _cached_engine
+    engine = _cached_engine
+    if engine is None:
+        with _engine_lock:
+            engine = _cached_engine
+            if engine is None:
+                engine = _cached_engine = create_engine_from_config(db_config)
+    return engine
+
+
+def get_session() -> Iterator[Session]:
+    """Yield one database session per request.
+
+    FastAPI (0.118+, the pinned floor) closes it after the response has been
+    sent, so streamed responses can keep reading from it; all helpers of a
+    request share its view of the database.
+    """
+    with Session(_engine()) as session:
+        yield session
 
 
-def _load_atomic_graph(session: Session, *, scopes: set[str] | None = None) -> nx.DiGraph:
+# Rows fetched from the cursor at a time while streaming query results.
+_ROW_BATCH_SIZE = 1000
+# Keys per `IN (...)` list; well below SQLite's and PostgreSQL's bind limits.
+_IN_LIST_SIZE = 500
+
+
+def _load_atomic_graph(
+    session: Session,
+    *,
+    scopes: set[str] | None = None,
+    gavs: Sequence[str] | None = None,
+) -> DepGraph:
     """Load the *atomic* dependency graph from the database.
 
     Atomic graph means: every node is a full `group:artifact:version` (GAV).
 
     Edge direction follows Maven dependency semantics:
         A -> B means "A depends on B".
+
+    `gavs` restricts the result to the subgraph induced by those nodes: only
+    edges between two of them are read, through the `to_gav` index.
     """
-    g = nx.DiGraph()
+    g = DepGraph()
 
-    for a in session.exec(select(Artifact)).all():
-        g.add_node(a.gav)
+    # Column tuples only: no ORM instances or identity-map entries per row.
+    g.add_nodes_from(session.exec(select(Artifact.gav)).all() if gavs is None else gavs)
 
     scopes_norm = {s.strip().lower() for s in (scopes or set()) if (s or "").strip()}
 
-    for e in session.exec(select(DependencyEdge)).all():
-        scope_val = (e.scope or "compile").strip()
-        if scopes_norm and scope_val.lower() not in scopes_norm:
-            continue
+    stmt = select(DependencyEdge.from_gav, DependencyEdge.to_gav, DependencyEdge.scope, DependencyEdge.optional)
+    if scopes_norm:
+        # Filter in SQL so unselected scopes never leave the database. Same
+        # normalization as below: missing or empty scope counts as "compile".
+        scope_col = func.coalesce(func.nullif(DependencyEdge.scope, ""), "compile")
+        stmt = stmt.where(func.lower(func.trim(scope_col)).in_(scopes_norm))
 
-        g.add_node(e.from_gav)
-        g.add_node(e.to_gav)
-        g.add_edge(e.from_gav, e.to_gav, scope=scope_val, optional=e.optional)
+    if gavs is None:
+        stmts = [stmt]
+    else:
+        stmts = [
+            stmt.where(DependencyEdge.to_gav.in_(gavs[start : start + _IN_LIST_SIZE]))
+            for start in range(0, len(gavs), _IN_LIST_SIZE)
+        ]
+        wanted = set(gavs)
+
+    edges: list[tuple[str, str, dict[str, Any]]] = []
+    for chunk_stmt in stmts:
+        for from_gav, to_gav, scope, optional in session.exec(chunk_stmt.execution_options(yield_per=_ROW_BATCH_SIZE)):
+            if gavs is None or from_gav in wanted:
+                edges.append((from_gav, to_gav, {"scope": (scope or "compile").strip(), "optional": optional}))
+    g.add_edges_from(edges)
 
     return g
 
 
+# Recently built graphs, keyed by database fingerprint, scope filter and
+# aggregation toggles. Graph reads (UI polling) far outnumber uploads, so most
+# requests skip reloading every row. Cached graphs are shared between
+# requests and must not be mutated; `subgraph()` returns a copy.
+_GRAPH_CACHE_SIZE = 8
+_graph_cache: OrderedDict[tuple[Any, ...], DepGraph] = OrderedDict()
+_graph_cache_lock = threading.Lock()
+
+
+def _graph_fingerprint(session: Session) -> tuple[Any, ...]:
+    """Return a cheap value that changes whenever the stored graph changes.
+
+    Every writing transaction bumps the graph version counter, so it is one
+    primary-key read. The database URL keeps different databases (e.g. after
+    a config swap) apart.
+    """
+    return (str(session.get_bind().url), graph_version(session))
+
+
+# Polled views revalidate on every request; unchanged data costs one
+# fingerprint query and an empty 304.
+_REVALIDATE = "private, max-age=0, must-revalidate"
+
+
+def _etag(request: Request, fingerprint: tuple[Any, ...]) -> str:
+    """Weak ETag for a response fully determined by the stored data and the URL.
+
+    Weak, because the same representation may be sent gzipped or not.
+    """
+    key = repr((fingerprint, request.url.path, request.url.query)).encode()
+    return f'W/"{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the client's `If-None-Match` matches `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    opaque = etag.removeprefix("W/")
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    if opaque in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _REVALIDATE})
+    return None
+
+
+def _with_etag(response: Any, etag: str) -> Any:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _REVALIDATE
+    return response
+
+
+def _graph_cache_get(key: tuple[Any, ...]) -> DepGraph | None:
+    with _graph_cache_lock:
+        g = _graph_cache.get(key)
+        if g is not None:
+            _graph_cache.move_to_end(key)
+        return g
+
+
+def _graph_cache_put(key: tuple[Any, ...], g: DepGraph) -> None:
+    with _graph_cache_lock:
+        _graph_cache[key] = g
+        _graph_cache.move_to_end(key)
+        while len(_graph_cache) > _GRAPH_CACHE_SIZE:
+            _graph_cache.popitem(last=False)
+
+
+# Encoded responses of the global graph view (no root), keyed by the request
+# parameters that shape them. Each entry holds the graph it was rendered from;
+# an upload yields a new graph object, which makes the entry stale. Values are
+# `[graph, json_bytes, gzip_bytes | None]`; the gzip copy is made on demand.
+_global_payloads: OrderedDict[tuple[Any, ...], list[Any]] = OrderedDict()
+
+
+def _global_payload_get(key: tuple[Any, ...], g: DepGraph) -> list[Any] | None:
+    with _graph_cache_lock:
+        entry = _global_payloads.get(key)
+        if entry is None or entry[0] is not g:
+            return None
+        _global_payloads.move_to_end(key)
+        return entry
+
+
+def _global_payload_put(key: tuple[Any, ...], entry: list[Any]) -> None:
+    with _graph_cache_lock:
+        _global_payloads[key] = entry
+        _global_payloads.move_to_end(key)
+        while len(_global_payloads) > _GRAPH_CACHE_SIZE:
+            _global_payloads.popitem(last=False)
+
+
+def _global_payload_response(request: Request, entry: list[Any]) -> Response:
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" not in request.headers.get("accept-encoding", ""):
+        return Response(content=entry[1], media_type="application/json", headers=headers)
+    if entry[2] is None:
+        # Racing requests may both compress; either result is correct.
+        entry[2] = gzip.compress(entry[1], compresslevel=6)
+    headers["Content-Encoding"] = "gzip"
+    return Response(content=entry[2], media_type="application/json", headers=headers)
+
+
+# Sorted scope names, keyed by the graph fingerprint: the scope set can only
+# change when the graph version does.
+_edge_scopes_cache: dict[tuple[Any, ...], list[str]] = {}
+
+
+def _edge_scopes(session: Session) -> list[str]:
+    """Return the sorted distinct edge scopes (missing scope shown as "compile").
+
+    Page renders ask for these on every load; the version lookup is a
+    primary-key probe, while the DISTINCT scan runs only after new uploads.
+    """
+    key = _graph_fingerprint(session)
+    scopes = _edge_scopes_cache.get(key)
+    if scopes is None:
+        rows = session.exec(select(DependencyEdge.scope).distinct()).all()
+        scopes = sorted({s or "compile" for s in rows})
+        # Older watermarks are never asked for again.
+        _edge_scopes_cache.clear()
+        _edge_scopes_cache[key] = scopes
+    return scopes
+
+
+def _aggregated_graph_key(
+    fingerprint: tuple[Any, ...],
+    scopes: Iterable[str],
+    *,
+    show_group: bool,
+    show_version: bool,
+) -> tuple[Any, ...]:
+    scope_key = frozenset(s.strip().lower() for s in scopes if (s or "").strip())
+    return (fingerprint, scope_key, show_group, show_version)
+
+
+def _aggregated_graph(
+    session: Session,
+    *,
+    scopes: set[str],
+    show_group: bool,
+    show_version: bool,
+    fingerprint: tuple[Any, ...] | None = None,
+) -> DepGraph:
+    """Return the aggregated graph, rebuilding it only when the data changed.
+
+    `fingerprint` may be passed when the caller already has it for this session.
+    """
+    if fingerprint is None:
+        fingerprint = _graph_fingerprint(session)
+    key = _aggregated_graph_key(fingerprint, scopes, show_group=show_group, show_version=show_version)
+    base_key = key[:2]
+
+    g = _graph_cache_get(key)
+    if g is None:
+        atomic_key = (*base_key, None, None)
+        atomic = _graph_cache_get(atomic_key)
+        if atomic is None:
+            atomic = _load_atomic_graph(session, scopes=scopes)
+            _graph_cache_put(atomic_key, atomic)
+        g = aggregate_graph(atomic, show_group=show_group, show_version=show_version)
+        _graph_cache_put(key, g)
+    return g
+
+
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request) -> Any:
     """Dashboard page.
@@ -109,9 +372,9 @@ def home(request: Request) -> Any:
     It contains an upload widget and a global dependency graph.
     """
     return templates.TemplateResponse(
+        request,
         "index.html",
         {
-            "request": request,
             "db_path": str(DB_PATH),
             # Default to unchecked (per latest DESIGN/UX request).
             "show_group": False,
@@ -129,7 +392,12 @@ def graph_global(request: Request) -> Any:
 
 
 @app.get("/visualize/{root_id}", response_class=HTMLResponse)
-def visualize(request: Request, root_id: str, scope: list[str] | None = Query(None)) -> Any:
+def visualize(
+    request: Request,
+    root_id: str,
+    scope: list[str] | None = Query(None),
+    session: Session = Depends(get_session),
+) -> Any:
     """Detail page centered on a selected artifact (root_id).
 
     root_id is a string key we use everywhere; usually it is a full GAV.
@@ -137,17 +405,14 @@ def visualize(request: Request, root_id: str, scope: list[str] | None = Query(No
     """
     g, a, v = _split_gav(root_id)
 
-    with Session(_engine()) as session:
-        scopes = session.exec(select(DependencyEdge.scope).distinct()).all()
-    scope_set = {s or "compile" for s in scopes}
-    scopes_sorted = sorted(scope_set)
+    scopes_sorted = _edge_scopes(session)
 
     selected_scopes = scope or []
 
     return templates.TemplateResponse(
+        request,
         "visualize.html",
         {
-            "request": request,
             "root_id": root_id,
             "root_group": g,
             "root_artifact": a,
@@ -165,23 +430,24 @@ def visualize(request: Request, root_id: str, scope: list[str] | None = Query(No
 
 
 @app.get("/details/{root_id}", response_class=HTMLResponse)
-def details(request: Request, root_id: str, scope: list[str] | None = Query(None)) -> Any:
+def details(
+    request: Request,
+    root_id: str,
+    scope: list[str] | None = Query(None),
+    session: Session = Depends(get_session),
+) -> Any:
     # /details is a convenience alias to /visualize; make sure to forward query params.
-    return visualize(request, root_id, scope=scope)
+    return visualize(request, root_id, scope=scope, session=session)
 
 
 @app.get("/dependencies/list", response_class=HTMLResponse)
-def dependencies_list(request: Request) -> Any:
-    with Session(_engine()) as session:
-        scopes = session.exec(select(DependencyEdge.scope).distinct()).all()
-
-    scope_set = {s or "compile" for s in scopes}
-    scopes_sorted = sorted(scope_set)
+def dependencies_list(request: Request, session: Session = Depends(get_session)) -> Any:
+    scopes_sorted = _edge_scopes(session)
 
     return templates.TemplateResponse(
+        request,
         "dependencies_list.html",
         {
-            "request": request,
             "db_path": str(DB_PATH),
             "scopes": scopes_sorted,
             "wide": True,
@@ -206,76 +472,107 @@ def export_page(request: Request) -> Any:
     ]
 
     return templates.TemplateResponse(
+        request,
         "export.html",
         {
-            "request": request,
             "db_path": str(DB_PATH),
             "tables": tables,
         },
     )
 
 
-_TABLE_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+# Rows per csv `writerows` call, and buffered CSV text sent per chunk of a
+# streamed export.
+_CSV_BATCH_ROWS = 100
+_CSV_FLUSH_BYTES = 64 * 1024
 
 
-@app.get("/export/{table}.csv")
-def export_table_csv(table: str) -> StreamingResponse:
-    if not _TABLE_NAME_RE.match(table):
-        return JSONResponse({"error": "Invalid table name"}, status_code=400)
+def _csv_chunks(header: list[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Render CSV incrementally, yielding ~`_CSV_FLUSH_BYTES` of text at a time.
 
-    table_obj = SQLModel.metadata.tables.get(table)
-    if table_obj is None:
-        return JSONResponse({"error": "Table not found"}, status_code=404)
+    Rows are written with `writerows` in batches, and the header goes out
+    first so the download starts before the first query result.
+    """
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    yield buf.getvalue()
+    buf.seek(0)
+    buf.truncate(0)
+
+    it = iter(rows)
+    while batch := list(islice(it, _CSV_BATCH_ROWS)):
+        writer.writerows(batch)
+        if buf.tell() >= _CSV_FLUSH_BYTES:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+    if buf.tell():
+        yield buf.getvalue()
 
-    columns = list(table_obj.columns)
-    header = [c.name for c in columns]
 
-    def _iter() -> Any:
-        import csv
-        import io
+def iter_table_csv(session: Session, table: str) -> Iterator[str]:
+    """Stream one table as CSV text, header first, without buffering it.
 
-        buf = io.StringIO()
-        writer = csv.writer(buf)
+    This is the generator behind `/export/{table}.csv`; in-process callers can
+    iterate it directly (`for chunk in iter_table_csv(session, "artifact")`)
+    and hold only one cursor batch and one text chunk at a time. Chunks are
+    not line-aligned. Close the generator to release the cursor early.
 
-        writer.writerow(header)
-        yield buf.getvalue()
-        buf.seek(0)
-        buf.truncate(0)
-
-        with Session(_engine()) as session:
-            result = session.connection().execute(sa_select(table_obj))
-            for row in result:
-                mapping = row._mapping
-                writer.writerow(["" if mapping.get(c) is None else mapping.get(c) for c in columns])
-                yield buf.getvalue()
-                buf.seek(0)
-                buf.truncate(0)
+    Args:
+        session: Open database session; must outlive the iteration.
+        table: Name of a SQLModel table, as listed on the export page.
+
+    Raises:
+        KeyError: On first iteration, if `table` is not a known table.
+    """
+    table_obj = SQLModel.metadata.tables[table]
+    header = [c.name for c in table_obj.columns]
+    conn = session.connection().execution_options(yield_per=_ROW_BATCH_SIZE)
+    # Closing the result releases the cursor as soon as the download ends
+    # or is abandoned, not when the request's session is torn down.
+    with conn.execute(sa_select(table_obj)) as result:
+        # csv writes None as an empty field.
+        yield from _csv_chunks(header, result)
+
+
+@app.get("/export/{table}.csv")
+def export_table_csv(table: str, session: Session = Depends(get_session)) -> StreamingResponse:
+    # ASCII identifiers only, i.e. [A-Za-z_][A-Za-z0-9_]*, checked in C.
+    if not (table.isascii() and table.isidentifier()):
+        return JSONResponse({"error": "Invalid table name"}, status_code=400)
+    if table not in SQLModel.metadata.tables:
+        return JSONResponse({"error": "Table not found"}, status_code=404)
 
     headers = {"Content-Disposition": f"attachment; filename={table}.csv"}
-    return StreamingResponse(_iter(), media_type="text/csv; charset=utf-8", headers=headers)
+    return StreamingResponse(iter_table_csv(session, table), media_type="text/csv; charset=utf-8", headers=headers)
 
 
 @app.get("/design-system", response_class=HTMLResponse)
 def design_system_page(request: Request) -> Any:
     """Mockup page for the new Material + Tailwind Design System."""
-    return templates.TemplateResponse(
-        "design_system.html",
-        {"request": request}
-    )
+    return templates.TemplateResponse(request, "design_system.html")
 
 
 @app.get("/partials/artifacts-table", response_class=HTMLResponse)
-def artifacts_table_partial(request: Request, q: str | None = None, limit: int = 200) -> Any:
-    with Session(_engine()) as session:
-        stmt = select(Artifact)
-        if q:
-            stmt = stmt.where(Artifact.artifact_id.contains(q))
-        artifacts = session.exec(stmt.limit(limit)).all()
+def artifacts_table_partial(
+    request: Request,
+    q: str | None = None,
+    limit: int = 200,
+    session: Session = Depends(get_session),
+) -> Any:
+    # Column rows keep attribute access (`a.gav`) without hydrating models.
+    stmt = select(Artifact.gav, Artifact.group_id, Artifact.artifact_id, Artifact.version)
+    q_norm = (q or "").strip().lower()
+    if q_norm:
+        # Case-insensitive, like the dependencies list filters.
+        stmt = stmt.where(func.lower(Artifact.artifact_id).contains(q_norm, autoescape=True))
+    artifacts = session.exec(stmt.limit(limit)).all()
 
     return templates.TemplateResponse(
+        request,
         "partials/artifacts_table.html",
         {
-            "request": request,
             "artifacts": artifacts,
             "q": q or "",
             "limit": limit,
@@ -283,58 +580,43 @@ def artifacts_table_partial(request: Request, q: str | None = None, limit: int =
     )
 
 
-def _split_gav(gav: str) -> tuple[str, str, str]:
-    """Split a GAV string into (group, artifact, version).
+def _distinct_scopes(session: Session, scope_col: Any) -> Any:
+    """Aggregate expression collecting the distinct scopes of a group, comma-joined."""
+    if session.get_bind().dialect.name == "postgresql":
+        return func.string_agg(distinct(scope_col), literal(","))
+    return func.group_concat(distinct(scope_col))
 
-    Maven coordinates are typically 3-part, but in this app we defensively handle
-    partial strings to keep the UI resilient.
-    """
-    parts = (gav or "").split(":")
-    if len(parts) >= 3:
-        return parts[0] or "Unknown", parts[1] or "Unknown", parts[2] or "Unknown"
-    if len(parts) == 2:
-        return parts[0] or "Unknown", parts[1] or "Unknown", "Unknown"
-    if len(parts) == 1:
-        return "Unknown", parts[0] or "Unknown", "Unknown"
-    return "Unknown", "Unknown", "Unknown"
-
-
-def _display_key(
-    gav: str,
-    artifact: Artifact | None,
-    *,
-    ignore_group: bool,
-    ignore_version: bool,
-) -> tuple[str, str, str, str]:
-    """Build an aggregation/display key for the dependencies table.
-
-    This is used by the "Dependencies (Pair List)" view to optionally *merge*
-    rows when the user ticks "Ignore Version" and/or "Ignore GroupId".
-    The returned tuple contains:
-      - key: internal dedup key (string)
-      - group_disp / artifact_disp / version_disp: what to display in the table
-    """
-    if artifact is not None:
-        g, a, v = artifact.group_id or "Unknown", artifact.artifact_id, artifact.version or "Unknown"
-    else:
-        g, a, v = _split_gav(gav)
-
-    if ignore_group and ignore_version:
-        key = a
-    elif ignore_group and not ignore_version:
-        key = f"{a}:{v}"
-    elif (not ignore_group) and ignore_version:
-        key = f"{g}:{a}"
-    else:
-        key = f"{g}:{a}:{v}"
 
-    group_disp = "" if ignore_group else g
-    version_disp = "" if ignore_version else v
+def _split_gav_sql(session: Session, gav_col: Any) -> tuple[Any, Any, Any]:
+    """SQL version of `_split_gav` without the "Unknown" padding.
 
-    return key, group_disp, a, version_disp
+    Returns (group, artifact, version) expressions; missing parts are ''. A
+    GAV without ':' is all artifact, and parts after the third are dropped.
+    Constants are inlined literals (see `_iter_dependency_rows`).
+    """
+    # Same (string, substring) argument order on both backends.
+    pos = func.strpos if session.get_bind().dialect.name == "postgresql" else func.instr
+    zero = literal_column("0")
+    one = literal_column("1")
+    colon = literal_column("':'")
+    empty = literal_column("''")
+
+    p1 = pos(gav_col, colon)
+    rest = func.substr(gav_col, p1 + one)
+    p2 = pos(rest, colon)
+    rest2 = func.substr(rest, p2 + one)
+    p3 = pos(rest2, colon)
+
+    group = case((p1 == zero, empty), else_=func.substr(gav_col, one, p1 - one))
+    artifact = case((p1 == zero, gav_col), (p2 == zero, rest), else_=func.substr(rest, one, p2 - one))
+    version = case(
+        (p1 == zero, empty), (p2 == zero, empty), (p3 == zero, rest2), else_=func.substr(rest2, one, p3 - one)
+    )
+    return group, artifact, version
 
 
 def _dependency_rows(
+    session: Session,
     *,
     q: str | None,
     group_q: str | None,
@@ -349,120 +631,161 @@ def _dependency_rows(
         Both the table partial and the CSV export should produce exactly the same
         rows for the same query parameters.
     """
-    q_norm = (q or "").strip().lower()
-    group_q_norm = (group_q or "").strip().lower()
-    scopes_norm = {s.strip().lower() for s in (scopes or []) if (s or "").strip()}
+    return list(
+        _iter_dependency_rows(
+            session,
+            q=q,
+            group_q=group_q,
+            scopes=scopes,
+            ignore_version=ignore_version,
+            ignore_group=ignore_group,
+            limit=limit,
+        )
+    )
 
-    with Session(_engine()) as session:
-        # IMPORTANT: do not hard-limit edges here.
-        # The list view and CSV export are expected to reflect the full DB result
-        # set (subject only to the caller-provided `limit`). A previous hidden
-        # `.limit(2000)` caused silent truncation.
-        edges = session.exec(select(DependencyEdge)).all()
 
-        gavs: set[str] = set()
-        for e in edges:
-            gavs.add(e.from_gav)
-            gavs.add(e.to_gav)
+def _dependency_rows_from(stmt: Any, src: Any, tgt: Any) -> Any:
+    # Edges with both endpoints' Artifact rows, when present.
+    return (
+        stmt.select_from(DependencyEdge)
+        .outerjoin(src, src.gav == DependencyEdge.from_gav)
+        .outerjoin(tgt, tgt.gav == DependencyEdge.to_gav)
+    )
+
+
+def _iter_dependency_rows(
+    session: Session,
+    *,
+    q: str | None,
+    group_q: str | None,
+    scopes: list[str] | None,
+    ignore_version: bool,
+    ignore_group: bool,
+    limit: int | None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the dependencies list rows as they come off the database cursor.
 
-        artifacts_by_gav: dict[str, Artifact] = {}
-        if gavs:
-            artifacts = session.exec(select(Artifact).where(Artifact.gav.in_(list(gavs)))).all()
-            artifacts_by_gav = {a.gav: a for a in artifacts}
+    Filtering, the optional merge (`GROUP BY` over the displayed columns) and
+    the limit all run in SQL, so only the final rows reach Python. `session`
+    must stay open until the generator is exhausted or closed.
+    """
+    q_norm = (q or "").strip().lower()
+    group_q_norm = (group_q or "").strip().lower()
+    scopes_norm = {s.strip().lower() for s in (scopes or []) if (s or "").strip()}
 
-    rows: list[dict[str, Any]] = []
+    src = aliased(Artifact, name="src")
+    tgt = aliased(Artifact, name="tgt")
+    edge = DependencyEdge
+
+    # Constants are inlined SQL literals, not bind parameters, so grouped
+    # expressions in SELECT and GROUP BY are textually identical (PostgreSQL
+    # requires that; positional drivers would number each bind differently).
+    empty = literal_column("''")
+    unknown = literal_column("'Unknown'")
+
+    def _coords(art: Any, gav_col: Any) -> tuple[Any, Any, Any]:
+        # An edge endpoint without an Artifact row is shown split from its
+        # GAV, like `_split_gav`; empty parts read "Unknown".
+        g, a, v = _split_gav_sql(session, gav_col)
+        missing = art.gav.is_(None)
+        return (
+            func.coalesce(func.nullif(case((missing, g), else_=art.group_id), empty), unknown),
+            case((missing, func.coalesce(func.nullif(a, empty), unknown)), else_=art.artifact_id),
+            func.coalesce(func.nullif(case((missing, v), else_=art.version), empty), unknown),
+        )
 
-    if ignore_group or ignore_version:
-        agg: dict[tuple[str, str], dict[str, Any]] = {}
-        for e in edges:
-            scope_val = (e.scope or "compile")
-            if scopes_norm and scope_val.strip().lower() not in scopes_norm:
-                continue
-
-            src_art = artifacts_by_gav.get(e.from_gav)
-            tgt_art = artifacts_by_gav.get(e.to_gav)
-
-            src_group_raw = (src_art.group_id if src_art is not None else _split_gav(e.from_gav)[0]) or "Unknown"
-            tgt_group_raw = (tgt_art.group_id if tgt_art is not None else _split_gav(e.to_gav)[0]) or "Unknown"
-            if group_q_norm:
-                if group_q_norm not in src_group_raw.lower() and group_q_norm not in tgt_group_raw.lower():
-                    continue
-
-            src_key, sg, sa, sv = _display_key(
-                e.from_gav,
-                src_art,
-                ignore_group=ignore_group,
-                ignore_version=ignore_version,
+    sg, sa, sv = _coords(src, edge.from_gav)
+    tg, ta, tv = _coords(tgt, edge.to_gav)
+    scope_col = func.coalesce(func.nullif(edge.scope, empty), literal_column("'compile'"))
+
+    conditions: list[Any] = []
+    if scopes_norm:
+        conditions.append(func.lower(func.trim(scope_col)).in_(scopes_norm))
+    if group_q_norm:
+        conditions.append(
+            or_(
+                func.lower(sg).contains(group_q_norm, autoescape=True),
+                func.lower(tg).contains(group_q_norm, autoescape=True),
             )
-            tgt_key, tg, ta, tv = _display_key(
-                e.to_gav,
-                tgt_art,
-                ignore_group=ignore_group,
-                ignore_version=ignore_version,
+        )
+    if q_norm:
+        conditions.append(
+            or_(
+                func.lower(sa).contains(q_norm, autoescape=True),
+                func.lower(ta).contains(q_norm, autoescape=True),
             )
+        )
 
-            if q_norm:
-                if q_norm not in (sa or "").lower() and q_norm not in (ta or "").lower():
-                    continue
-
-            k = (src_key, tgt_key)
-            if k not in agg:
-                agg[k] = {
-                    "source_group": sg,
-                    "source_artifact": sa,
-                    "source_version": sv,
-                    "target_group": tg,
-                    "target_artifact": ta,
-                    "target_version": tv,
-                    "scopes": set(),
-                    # DESIGN.md: click should go to Group 1 (source).
-                    "details_id": e.from_gav,
-                }
-            agg[k]["scopes"].add(e.scope or "compile")
-
-        for item in agg.values():
-            rows.append(
-                {
-                    **{k: v for k, v in item.items() if k != "scopes"},
-                    "scope": ", ".join(sorted(item["scopes"])) if item["scopes"] else "compile",
-                }
+    # IMPORTANT: do not hard-limit edges here.
+    # The list view and CSV export are expected to reflect the full DB result
+    # set (subject only to the caller-provided `limit`). A previous hidden
+    # `.limit(2000)` caused silent truncation.
+    if ignore_group or ignore_version:
+        # Merge rows that look the same once group and/or version are hidden.
+        # Hidden columns are selected as '' so every selected column is
+        # either grouped or aggregated (required by PostgreSQL).
+        shown = [
+            (sg, not ignore_group), (sa, True), (sv, not ignore_version),
+            (tg, not ignore_group), (ta, True), (tv, not ignore_version),
+        ]
+        group_cols = [c for c, visible in shown if visible]
+        merged_rows = (
+            _dependency_rows_from(
+                sa_select(
+                    *(c if visible else empty.label(f"hidden_{i}") for i, (c, visible) in enumerate(shown)),
+                    _distinct_scopes(session, scope_col).label("scopes"),
+                    func.min(edge.id).label("first_id"),
+                ),
+                src,
+                tgt,
             )
+            .where(*conditions)
+            .group_by(*group_cols)
+            .subquery("merged")
+        )
+        # DESIGN.md: click should go to Group 1 (source), i.e. the source of
+        # the first-seen edge in the group; joined back by its id.
+        first = aliased(DependencyEdge, name="first_edge")
+        stmt = (
+            sa_select(*list(merged_rows.c)[:-1], first.from_gav)
+            .select_from(merged_rows)
+            .join(first, first.id == merged_rows.c.first_id)
+            # First-seen order, as if the edges were merged one by one.
+            .order_by(merged_rows.c.first_id)
+        )
     else:
-        for e in edges:
-            scope_val = (e.scope or "compile")
-            if scopes_norm and scope_val.strip().lower() not in scopes_norm:
-                continue
-
-            src_art = artifacts_by_gav.get(e.from_gav)
-            tgt_art = artifacts_by_gav.get(e.to_gav)
-            _, sg, sa, sv = _display_key(e.from_gav, src_art, ignore_group=False, ignore_version=False)
-            _, tg, ta, tv = _display_key(e.to_gav, tgt_art, ignore_group=False, ignore_version=False)
-
-            src_group_raw = (src_art.group_id if src_art is not None else _split_gav(e.from_gav)[0]) or "Unknown"
-            tgt_group_raw = (tgt_art.group_id if tgt_art is not None else _split_gav(e.to_gav)[0]) or "Unknown"
-            if group_q_norm:
-                if group_q_norm not in src_group_raw.lower() and group_q_norm not in tgt_group_raw.lower():
-                    continue
-
-            if q_norm:
-                if q_norm not in (sa or "").lower() and q_norm not in (ta or "").lower():
-                    continue
-
-            rows.append(
-                {
-                    "source_group": sg,
-                    "source_artifact": sa,
-                    "source_version": sv,
-                    "target_group": tg,
-                    "target_artifact": ta,
-                    "target_version": tv,
-                    "scope": scope_val,
-                    # DESIGN.md: click should go to Group 1 (source).
-                    "details_id": e.from_gav,
-                }
-            )
-
-    return rows if limit is None else rows[:limit]
+        stmt = (
+            _dependency_rows_from(sa_select(sg, sa, sv, tg, ta, tv, scope_col, edge.from_gav), src, tgt)
+            .where(*conditions)
+            .order_by(edge.id)
+        )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    # yield_per fetches in batches (a server-side cursor on PostgreSQL)
+    # instead of buffering the whole result.
+    # Merged rows carry only a handful of distinct raw scope lists, so
+    # normalize each one once per request rather than once per row.
+    scope_labels: dict[str, str] = {}
+    merged = ignore_group or ignore_version
+    # Closed on exhaustion and when the generator is closed early (e.g. an
+    # aborted CSV download), releasing the cursor right away.
+    with session.exec(stmt.execution_options(yield_per=_ROW_BATCH_SIZE)) as result:
+        for r_sg, r_sa, r_sv, r_tg, r_ta, r_tv, r_scope, details_id in result:
+            if merged:
+                label = scope_labels.get(r_scope)
+                if label is None:
+                    label = scope_labels[r_scope] = ", ".join(sorted(set(r_scope.split(","))))
+                r_scope = label
+            yield {
+                "source_group": r_sg,
+                "source_artifact": r_sa,
+                "source_version": r_sv,
+                "target_group": r_tg,
+                "target_artifact": r_ta,
+                "target_version": r_tv,
+                "scope": r_scope,
+                "details_id": details_id,
+            }
 
 
 @app.get("/partials/dependencies-table", response_class=HTMLResponse)
@@ -474,8 +797,14 @@ def dependencies_table_partial(
     ignore_version: bool = False,
     ignore_group: bool = False,
     limit: int | None = Query(None, ge=1),
+    session: Session = Depends(get_session),
 ) -> Any:
+    etag = _etag(request, _graph_fingerprint(session))
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+
     rows = _dependency_rows(
+        session,
         q=q,
         group_q=group_q,
         scopes=scope,
@@ -484,10 +813,10 @@ def dependencies_table_partial(
         limit=limit,
     )
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
+        request,
         "partials/dependencies_table.html",
         {
-            "request": request,
             "rows": rows,
             "q": q or "",
             "group_q": group_q or "",
@@ -497,6 +826,7 @@ def dependencies_table_partial(
             "limit": limit,
         },
     )
+    return _with_etag(response, etag)
 
 
 @app.get("/api/dependencies/export")
@@ -507,163 +837,122 @@ def export_dependencies_csv(
     ignore_version: bool = False,
     ignore_group: bool = False,
     limit: int | None = Query(None, ge=1),
+    session: Session = Depends(get_session),
 ) -> StreamingResponse:
-    rows = _dependency_rows(
-        q=q,
-        group_q=group_q,
-        scopes=scope,
-        ignore_version=ignore_version,
-        ignore_group=ignore_group,
-        limit=limit,
-    )
+    header = [
+        "source_group",
+        "source_artifact",
+        "source_version",
+        "target_group",
+        "target_artifact",
+        "target_version",
+        "scope",
+    ]
 
-    def _iter() -> Any:
-        import csv
-        import io
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(
-            [
-                "source_group",
-                "source_artifact",
-                "source_version",
-                "target_group",
-                "target_artifact",
-                "target_version",
-                "scope",
-            ]
+    def _iter() -> Iterator[str]:
+        rows = _iter_dependency_rows(
+            session,
+            q=q,
+            group_q=group_q,
+            scopes=scope,
+            ignore_version=ignore_version,
+            ignore_group=ignore_group,
+            limit=limit,
         )
-        for r in rows:
-            writer.writerow(
-                [
-                    r.get("source_group", ""),
-                    r.get("source_artifact", ""),
-                    r.get("source_version", ""),
-                    r.get("target_group", ""),
-                    r.get("target_artifact", ""),
-                    r.get("target_version", ""),
-                    r.get("scope", ""),
-                ]
-            )
-
-        yield buf.getvalue()
+        # Close the row generator (and its cursor) even if the client goes away.
+        with closing(rows):
+            yield from _csv_chunks(header, ([r[k] for k in header] for r in rows))
 
     headers = {"Content-Disposition": "attachment; filename=dependencies.csv"}
     return StreamingResponse(_iter(), media_type="text/csv; charset=utf-8", headers=headers)
 
 
+# Long-lived process pool for POM parsing, started on the first large upload
+# and reused afterwards instead of starting new workers per request. Workers
+# are spawned, not forked: the server is multithreaded by then, and a forked
+# child could inherit a lock (e.g. the shared lxml parser's) held by another
+# thread and hang.
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    pool = _parse_pool
+    if pool is None:
+        # Concurrent first uploads must not each start (and leak) a pool.
+        with _parse_pool_lock:
+            pool = _parse_pool
+            if pool is None:
+                pool = _parse_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return pool
+
+
+@app.on_event("shutdown")
+def _shutdown() -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(cancel_futures=True)
+            _parse_pool = None
+
+
+def _store_and_ingest(uploads: list[tuple[str, bytes]], scopes: list[str] | None) -> tuple[int, int]:
+    """Write uploaded POMs to a temp dir, parse them and store the results.
+
+    Blocking; `upload_poms` runs it in the threadpool.
+
+    Returns:
+        `(ingested_projects, ingested_edges)` as reported by `ingest_projects`.
+    """
+    with tempfile.TemporaryDirectory() as td:
+        tmpdir = Path(td)
+        paths: list[Path] = []
+        for filename, data in uploads:
+            p = tmpdir / Path(filename).name
+            p.write_bytes(data)
+            paths.append(p)
+
+        # One explicit transaction for the whole upload: committed on
+        # success, rolled back as a unit if any POM fails to parse.
+        with Session(_engine()) as session, session.begin():
+            # Small batches are parsed inline; the pool's workers are only
+            # spawned once a batch is large enough to be handed to it.
+            projects = parse_poms(paths, executor=_get_parse_pool())
+            return ingest_projects(session, projects, scopes=scopes)
+
+
 @app.post("/api/upload", response_class=HTMLResponse)
-async def upload_poms(request: Request, files: list[UploadFile] = File(...)) -> Any:
+async def upload_poms(
+    request: Request,
+    files: list[UploadFile] = File(...),
+    scope: list[str] | None = Query(None),
+) -> Any:
+    """Parse uploaded POMs and store their artifacts and dependency edges.
+
+    `scope` optionally restricts which dependency scopes are stored
+    (e.g. `?scope=compile&scope=runtime`); by default every scope is kept.
+    """
     parsed = 0
     ingested_edges = 0
     ingested_projects = 0
 
     try:
-        with tempfile.TemporaryDirectory() as td:
-            tmpdir = Path(td)
-            projects = []
-
-            for f in files:
-                data = await f.read()
-                if not data:
-                    continue
-                filename = Path(f.filename or "upload.pom").name
-                p = tmpdir / filename
-                p.write_bytes(data)
-                projects.append(parse_pom(p))
-
-            with Session(_engine()) as session:
-                # Collect all GAVs we need to process
-                all_gavs: set[str] = set()
-                all_edges: list[tuple[str, str, str, bool | None]] = []  # (from, to, scope, optional)
-                
-                for proj in projects:
-                    a = proj.project
-                    a_gav = a.compact()
-                    all_gavs.add(a_gav)
-                    
-                    for dep in proj.dependencies:
-                        b_gav = dep.gav.compact()
-                        all_gavs.add(b_gav)
-                        scope = dep.scope or "compile"
-                        all_edges.append((a_gav, b_gav, scope, dep.optional))
-                
-                # Batch fetch existing artifacts
-                existing_artifacts: set[str] = set()
-                if all_gavs:
-                    existing = session.exec(
-                        select(Artifact.gav).where(Artifact.gav.in_(list(all_gavs)))
-                    ).all()
-                    existing_artifacts = set(existing)
-                
-                # Batch fetch existing edges
-                existing_edges: set[tuple[str, str, str, bool | None]] = set()
-                if all_edges:
-                    # Fetch all edges in one query
-                    edge_results = session.exec(select(DependencyEdge)).all()
-                    existing_edges = {
-                        (e.from_gav, e.to_gav, e.scope or "compile", e.optional)
-                        for e in edge_results
-                    }
-                
-                # Now process with in-memory lookups (no per-item DB queries)
-                for proj in projects:
-                    a = proj.project
-                    a_gav = a.compact()
-                    
-                    if a_gav not in existing_artifacts:
-                        session.add(
-                            Artifact(
-                                gav=a_gav,
-                                group_id=a.group_id,
-                                artifact_id=a.artifact_id,
-                                version=a.version,
-                            )
-                        )
-                        existing_artifacts.add(a_gav)
-                    
-                    for dep in proj.dependencies:
-                        b = dep.gav
-                        b_gav = b.compact()
-                        
-                        if b_gav not in existing_artifacts:
-                            session.add(
-                                Artifact(
-                                    gav=b_gav,
-                                    group_id=b.group_id,
-                                    artifact_id=b.artifact_id,
-                                    version=b.version,
-                                )
-                            )
-                            existing_artifacts.add(b_gav)
-                        
-                        scope = dep.scope or "compile"
-                        optional = dep.optional
-                        edge_key = (a_gav, b_gav, scope, optional)
-                        
-                        if edge_key not in existing_edges:
-                            session.add(
-                                DependencyEdge(
-                                    from_gav=a_gav,
-                                    to_gav=b_gav,
-                                    scope=scope,
-                                    optional=optional,
-                                )
-                            )
-                            existing_edges.add(edge_key)
-                            ingested_edges += 1
-                    
-                    ingested_projects += 1
-                
-                session.commit()
-
-            parsed = len(projects)
+        uploads: list[tuple[str, bytes]] = []
+        for f in files:
+            data = await f.read()
+            if data:
+                uploads.append((f.filename or "upload.pom", data))
+
+        # Disk writes, XML parsing and DB inserts are all blocking; run them
+        # off the event loop so other requests keep being served meanwhile.
+        ingested_projects, ingested_edges = await run_in_threadpool(_store_and_ingest, uploads, scope)
+        parsed = ingested_projects
 
         return templates.TemplateResponse(
+            request,
             "partials/upload_status.html",
             {
-                "request": request,
                 "ok": True,
                 "parsed": parsed,
                 "ingested_projects": ingested_projects,
@@ -673,9 +962,9 @@ async def upload_poms(request: Request, files: list[UploadFile] = File(...)) ->
         )
     except Exception as exc:
         return templates.TemplateResponse(
+            request,
             "partials/upload_status.html",
             {
-                "request": request,
                 "ok": False,
                 "error": str(exc),
                 "parsed": parsed,
@@ -687,26 +976,30 @@ async def upload_poms(request: Request, files: list[UploadFile] = File(...)) ->
         )
 
 
-@app.get("/api/artifacts", response_class=JSONResponse)
-def api_artifacts(limit: int = 500) -> dict[str, Any]:
-    with Session(_engine()) as session:
-        artifacts = session.exec(select(Artifact).limit(limit)).all()
+@app.get("/api/artifacts", response_class=OrjsonResponse)
+def api_artifacts(request: Request, limit: int = 500, session: Session = Depends(get_session)) -> Response:
+    etag = _etag(request, _graph_fingerprint(session))
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
 
-    return {
-        "items": [
-            {
-                "gav": a.gav,
-                "group_id": a.group_id,
-                "artifact_id": a.artifact_id,
-                "version": a.version,
-            }
-            for a in artifacts
-        ]
-    }
+    rows = session.exec(
+        select(Artifact.gav, Artifact.group_id, Artifact.artifact_id, Artifact.version).limit(limit)
+    ).all()
+
+    response = OrjsonResponse(
+        {
+            "items": [
+                {"gav": gav, "group_id": group_id, "artifact_id": artifact_id, "version": version}
+                for gav, group_id, artifact_id, version in rows
+            ]
+        }
+    )
+    return _with_etag(response, etag)
 
 
-@app.get("/api/graph/data", response_class=JSONResponse)
+@app.get("/api/graph/data", response_class=OrjsonResponse)
 def api_graph_data(
+    request: Request,
     root_id: str | None = None,
     direction: str = Query("forward", pattern="^(forward|reverse)$"),
     depth: int | None = Query(None, ge=1),
@@ -715,7 +1008,9 @@ def api_graph_data(
     scope: list[str] | None = Query(None),
     aggregate_group: bool | None = None,
     aggregate_version: bool | None = None,
-) -> dict[str, Any]:
+    layout: str = Query("elements", pattern="^(elements|columns)$"),
+    session: Session = Depends(get_session),
+) -> Response:
     """Return dependency graph data in Cytoscape.js `elements` format.
 
     Data flow (high level):
@@ -729,9 +1024,15 @@ def api_graph_data(
         - direction: forward (A -> B) or reverse (who depends on B)
         - depth: optional BFS depth; None means "All"
         - show_group/show_version: how node IDs are aggregated and how labels render
+        - layout: "elements" (Cytoscape element list) or "columns" (one list
+          per field, see `graph_to_cytoscape_columns`; smaller for big graphs)
 
     Compatibility:
         DESIGN.md uses aggregate_group/aggregate_version with inverted meaning.
+
+    Without a root the response is the whole graph; it is encoded once per
+    graph and served from memory (gzipped when the client accepts it). An
+    unchanged database answers `If-None-Match` revalidations with 304.
     """
     # Back-compat with design doc param naming.
     if aggregate_group is not None:
@@ -739,29 +1040,67 @@ def api_graph_data(
     if aggregate_version is not None:
         show_version = not aggregate_version
 
-    with Session(_engine()) as session:
-        atomic = _load_atomic_graph(session, scopes=set(scope or []))
+    fingerprint = _graph_fingerprint(session)
+    etag = _etag(request, fingerprint)
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+
+    g: DepGraph | None = None
+    if root_id and direction == "reverse" and depth in (None, 1) and show_group and show_version:
+        key = _aggregated_graph_key(fingerprint, scope or [], show_group=True, show_version=True)
+        g = _graph_cache_get(key)
+        if g is None and not key[1]:
+            # Nothing cached yet: read just the root's dependents (a recursive
+            # CTE over the to_gav index) instead of loading every edge.
+            # Unknown roots fall through to the whole-graph path below.
+            dependents = dependents_of(session, root_id, transitive=depth is None)
+            if dependents or session.get(Artifact, root_id) is not None:
+                # Same node/edge attributes as the cached graph path.
+                atomic = _load_atomic_graph(session, gavs=[root_id, *dependents])
+                g = aggregate_graph(atomic, show_group=True, show_version=True)
+    if g is None:
+        g = _aggregated_graph(
+            session,
+            scopes=set(scope or []),
+            show_group=show_group,
+            show_version=show_version,
+            fingerprint=fingerprint,
+        )
 
-    g = aggregate_graph(atomic, show_group=show_group, show_version=show_version)
+    global_key: tuple[Any, ...] | None = None
+    if not root_id:
+        scope_key = frozenset(s.strip().lower() for s in (scope or []) if (s or "").strip())
+        global_key = (scope_key, show_group, show_version, direction, depth, layout)
+        entry = _global_payload_get(global_key, g)
+        if entry is not None:
+            return _with_etag(_global_payload_response(request, entry), etag)
 
     root_key: str | None = None
     if root_id:
         root_key = aggregated_node_id(root_id, show_group=show_group, show_version=show_version)
 
+    keep: frozenset[str] | None = None
     if root_key and g.has_node(root_key):
         # Reduce payload size: only return a neighborhood when a root is selected.
+        # The cached graph is filtered in place rather than copied per request.
         keep = nodes_within_depth(g, root_key, direction=direction, depth=depth)
-        g = g.subgraph(keep).copy()
 
-    elements = graph_to_cytoscape_elements(
+    render = graph_to_cytoscape_columns if layout == "columns" else graph_to_cytoscape_elements
+    rendered = render(
         g,
         root_id=root_key,
         direction=direction,
         show_version=show_version,
+        nodes=keep,
     )
+    node_count = g.number_of_nodes() if keep is None else len(keep)
+    if layout == "columns":
+        edge_count = len(rendered["edges"]["source"])
+    else:
+        edge_count = len(rendered) - node_count
 
-    return {
-        "elements": elements,
+    payload = {
+        layout: rendered,
         "meta": {
             "root_id": root_id,
             "root_key": root_key,
@@ -769,10 +1108,15 @@ def api_graph_data(
             "depth": depth,
             "show_group": show_group,
             "show_version": show_version,
-            "node_count": g.number_of_nodes(),
-            "edge_count": g.number_of_edges(),
+            "node_count": node_count,
+            "edge_count": edge_count,
         },
     }
+    if global_key is not None:
+        entry = [g, orjson.dumps(payload), None]
+        _global_payload_put(global_key, entry)
+        return _with_etag(_global_payload_response(request, entry), etag)
+    return _with_etag(OrjsonResponse(payload), etag)
 
 
 if __name__ == "__main__":
@@ -791,6 +1135,8 @@ if __name__ == "__main__":
             port=8000,
             reload=True,
             reload_dirs=["src"],
+            # Templates are not auto-reloaded; restart on edits instead.
+            reload_includes=["*.py", "*.html"],
         )
     else:
         # Production mode: no reload, bind to all interfaces
@@ -1,25 +1,41 @@
-"""Pytest configuration and fixtures for j-dep-analyzer tests."""
-from __future__ import annotations
-
-import os
-import pytest
-
-# Force SQLite for all tests
-os.environ["JDEP_DB_TYPE"] = "sqlite"
-
-
-@pytest.fixture(autouse=True)
-def reset_cached_engine():
-    """Reset the cached database engine before and after each test.
-    
-    This ensures test isolation when tests modify the database config.
-    """
-    import main
-    
-    # Reset before test
-    main._cached_engine = None
-    
-    yield
-    
-    # Reset after test
-    main._cached_engine = None
+"""Pytest configuration and fixtures for j-dep-analyzer tests."""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Force SQLite for all tests
+os.environ["JDEP_DB_TYPE"] = "sqlite"
+
+
+@pytest.fixture(autouse=True)
+def reset_cached_engine():
+    """Reset the cached database engine before and after each test.
+    
+    This ensures test isolation when tests modify the database config.
+    """
+    import main
+    
+    # Reset before test
+    main._cached_engine = None
+    
+    yield
+    
+    # Reset after test
+    main._cached_engine = None
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Iterator[TestClient]:
+    """One TestClient for the whole session, with startup/shutdown run once.
+
+    Requests resolve the engine lazily, so tests that swap `main.db_config`
+    (together with the per-test engine reset above) still hit their own DB.
+    """
+    import main
+
+    with TestClient(main.app) as client:
+        yield client
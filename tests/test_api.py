@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+import main
+from j_dep_analyzer.config import DatabaseConfig
+from j_dep_analyzer.db import create_sqlite_engine, init_db
+from j_dep_analyzer.db_models import Artifact, DependencyEdge
+from j_dep_analyzer.ingest import bump_graph_version
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    db_path = tmp_path / "api-test.db"
+    monkeypatch.setattr(main, "db_config", DatabaseConfig(db_type="sqlite", sqlite_path=db_path))
+    engine = create_sqlite_engine(db_path)
+    init_db(engine)
+    with Session(engine) as session:
+        for gav in ("g:app:1", "g:lib:1", "g:core:1"):
+            group_id, artifact_id, version = gav.split(":")
+            session.add(Artifact(gav=gav, group_id=group_id, artifact_id=artifact_id, version=version))
+        session.add(DependencyEdge(from_gav="g:app:1", to_gav="g:lib:1", scope="compile", optional=True))
+        session.add(DependencyEdge(from_gav="g:lib:1", to_gav="g:core:1", scope="test"))
+        bump_graph_version(session)
+        session.commit()
+    return TestClient(main.app)
+
+
+def test_api_graph_data_reverse_neighborhood(client: TestClient) -> None:
+    res = client.get("/api/graph/data", params={"root_id": "g:core:1", "direction": "reverse", "depth": 1})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    body = res.json()
+    nodes = {e["data"]["id"]: e["classes"] for e in body["elements"] if "source" not in e["data"]}
+    assert nodes == {"g:core:1": "root", "g:lib:1": "highlight"}
+    assert body["meta"]["node_count"] == 2
+    assert body["meta"]["edge_count"] == 1
+
+
+def test_api_graph_data_reverse_from_sql_matches_cached_graph(client: TestClient) -> None:
+    params = {"root_id": "g:core:1", "direction": "reverse", "show_group": True, "show_version": True}
+
+    def _by_id(body: dict) -> list[dict]:
+        return sorted(body["elements"], key=lambda e: e["data"]["id"])
+
+    # Cold cache: answered from the dependents query, no whole graph loaded.
+    main._graph_cache.clear()
+    cold = client.get("/api/graph/data", params=params).json()
+    assert not main._graph_cache
+    # Warm cache (filled by the global view): cut from the in-memory graph.
+    client.get("/api/graph/data")
+    warm = client.get("/api/graph/data", params=params).json()
+
+    # Whole elements, attributes included, not just ids and edge pairs.
+    assert _by_id(cold) == _by_id(warm)
+    assert cold["meta"] == warm["meta"]
+    nodes = {e["data"]["id"]: e["data"] for e in cold["elements"] if "source" not in e["data"]}
+    edges = {(e["data"]["source"], e["data"]["target"]): e["data"] for e in cold["elements"] if "source" in e["data"]}
+    assert (nodes["g:app:1"]["artifact_id"], nodes["g:app:1"]["merged_count"]) == ("app", 1)
+    assert edges.keys() == {("g:app:1", "g:lib:1"), ("g:lib:1", "g:core:1")}
+    assert edges[("g:app:1", "g:lib:1")]["optional"] is True
+
+
+def test_api_graph_data_scope_filter(client: TestClient) -> None:
+    body = client.get("/api/graph/data", params={"scope": "TEST"}).json()
+
+    edges = [(e["data"]["source"], e["data"]["target"]) for e in body["elements"] if "source" in e["data"]]
+    assert edges == [("g:lib:1", "g:core:1")]
+    # Nodes without a matching edge are still listed.
+    assert body["meta"]["node_count"] == 3
+
+
+def test_api_artifacts_limit(client: TestClient) -> None:
+    res = client.get("/api/artifacts", params={"limit": 2})
+
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    items = res.json()["items"]
+    assert len(items) == 2
+    assert set(items[0]) == {"gav", "group_id", "artifact_id", "version"}
+
+
+def test_upload_poms_stores_projects_and_edges(client: TestClient) -> None:
+    pom = b"""<project>
+  <groupId>g</groupId><artifactId>svc</artifactId><version>2</version>
+  <dependencies>
+    <dependency><groupId>g</groupId><artifactId>lib</artifactId><version>1</version></dependency>
+  </dependencies>
+</project>"""
+
+    res = client.post("/api/upload", files=[("files", ("pom.xml", pom, "application/xml"))])
+
+    assert res.status_code == 200
+    with Session(create_sqlite_engine(main.db_config.sqlite_path)) as session:
+        edges = session.exec(select(DependencyEdge).where(DependencyEdge.from_gav == "g:svc:2")).all()
+    assert [e.to_gav for e in edges] == ["g:lib:1"]
+
+
+def test_api_graph_data_cache_refreshes_after_upload(client: TestClient) -> None:
+    def node_ids() -> set[str]:
+        body = client.get("/api/graph/data").json()
+        return {e["data"]["id"] for e in body["elements"] if "source" not in e["data"]}
+
+    assert node_ids() == {"g:app:1", "g:lib:1", "g:core:1"}
+    assert node_ids() == {"g:app:1", "g:lib:1", "g:core:1"}
+
+    pom = b"<project><groupId>g</groupId><artifactId>new</artifactId><version>1</version></project>"
+    assert client.post("/api/upload", files=[("files", ("pom.xml", pom))]).status_code == 200
+
+    assert "g:new:1" in node_ids()
+
+
+def test_api_graph_data_global_view_served_gzipped(client: TestClient) -> None:
+    plain = client.get("/api/graph/data", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/api/graph/data", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["content-encoding"] == "gzip"
+    # httpx transparently decodes the gzip body.
+    assert zipped.json() == plain.json()
+    assert plain.json()["meta"]["node_count"] == 3
+
+    columns = client.get("/api/graph/data", params={"layout": "columns"}).json()
+    assert sorted(columns["columns"]["nodes"]["id"]) == ["g:app:1", "g:core:1", "g:lib:1"]
+    assert columns["meta"]["edge_count"] == 2
+
+
+def test_api_graph_data_etag_revalidation(client: TestClient) -> None:
+    params = {"root_id": "g:core:1", "direction": "reverse"}
+    first = client.get("/api/graph/data", params=params)
+    etag = first.headers["etag"]
+
+    again = client.get("/api/graph/data", params=params, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    # Other parameters or new data change the tag.
+    other = client.get("/api/graph/data", params={**params, "depth": 1})
+    assert other.headers["etag"] != etag
+    with Session(create_sqlite_engine(main.db_config.sqlite_path)) as session:
+        session.add(DependencyEdge(from_gav="g:tool:1", to_gav="g:core:1", scope="compile"))
+        bump_graph_version(session)
+        session.commit()
+    fresh = client.get("/api/graph/data", params=params, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+def test_edge_scopes_refresh_after_new_edges(client: TestClient) -> None:
+    with Session(main._engine()) as session:
+        assert main._edge_scopes(session) == ["compile", "test"]
+        session.add(DependencyEdge(from_gav="g:app:1", to_gav="g:core:1", scope="runtime"))
+        bump_graph_version(session)
+        session.commit()
+        assert main._edge_scopes(session) == ["compile", "runtime", "test"]
+
+
+def test_dependency_rows_merge_in_sql(client: TestClient) -> None:
+    with Session(create_sqlite_engine(main.db_config.sqlite_path)) as session:
+        session.add(Artifact(gav="g:lib:2", group_id="g", artifact_id="lib", version="2"))
+        session.add(DependencyEdge(from_gav="g:app:1", to_gav="g:lib:2", scope="runtime"))
+        session.commit()
+
+    with Session(main._engine()) as session:
+        rows = main._dependency_rows(
+            session, q="LIB", group_q=None, scopes=None, ignore_version=True, ignore_group=False, limit=None
+        )
+
+    assert rows == [
+        {
+            "source_group": "g",
+            "source_artifact": "app",
+            "source_version": "",
+            "target_group": "g",
+            "target_artifact": "lib",
+            "target_version": "",
+            "scope": "compile, runtime",
+            "details_id": "g:app:1",
+        },
+        {
+            "source_group": "g",
+            "source_artifact": "lib",
+            "source_version": "",
+            "target_group": "g",
+            "target_artifact": "core",
+            "target_version": "",
+            "scope": "test",
+            "details_id": "g:lib:1",
+        },
+    ]
+
+
+def test_dependency_rows_merged_details_link_first_source(client: TestClient) -> None:
+    # "g:tool:10" sorts before "g:tool:9", but tool:9's edge came first.
+    with Session(create_sqlite_engine(main.db_config.sqlite_path)) as session:
+        for version in ("9", "10"):
+            session.add(Artifact(gav=f"g:tool:{version}", group_id="g", artifact_id="tool", version=version))
+        session.add(DependencyEdge(from_gav="g:tool:9", to_gav="g:core:1", scope="compile"))
+        session.add(DependencyEdge(from_gav="g:tool:10", to_gav="g:core:1", scope="compile"))
+        session.commit()
+
+    with Session(main._engine()) as session:
+        rows = main._dependency_rows(
+            session, q="tool", group_q=None, scopes=None, ignore_version=True, ignore_group=False, limit=None
+        )
+
+    assert [(r["source_artifact"], r["details_id"]) for r in rows] == [("tool", "g:tool:9")]
+
+
+def test_dependency_rows_split_gavs_without_artifact_rows(client: TestClient) -> None:
+    # Endpoints with no Artifact row are shown the way `_split_gav` splits them.
+    with Session(create_sqlite_engine(main.db_config.sqlite_path)) as session:
+        for to_gav in ("org.x:x-core:2:jar", "solo", "org.y:y-api", "org.z::3"):
+            session.add(DependencyEdge(from_gav="g:app:1", to_gav=to_gav, scope="compile"))
+        session.commit()
+
+    with Session(main._engine()) as session:
+        rows = main._dependency_rows(
+            session, q=None, group_q=None, scopes=None, ignore_version=False, ignore_group=False, limit=None
+        )
+        by_q = main._dependency_rows(
+            session, q="y-API", group_q="org", scopes=None, ignore_version=False, ignore_group=False, limit=None
+        )
+
+    targets = [(r["target_group"], r["target_artifact"], r["target_version"]) for r in rows[2:]]
+    assert targets == [
+        ("org.x", "x-core", "2"),
+        ("Unknown", "solo", "Unknown"),
+        ("org.y", "y-api", "Unknown"),
+        ("org.z", "Unknown", "3"),
+    ]
+    assert [r["target_artifact"] for r in by_q] == ["y-api"]
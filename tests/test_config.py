@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from j_dep_analyzer.config import DatabaseConfig, _config_from_env
+
+
+@pytest.fixture
+def fresh_env_config():
+    _config_from_env.cache_clear()
+    yield
+    _config_from_env.cache_clear()
+
+
+def test_from_env_is_cached_until_cleared(monkeypatch, tmp_path, fresh_env_config) -> None:
+    monkeypatch.setenv("JDEP_DB_TYPE", "sqlite")
+    monkeypatch.setenv("JDEP_DB_PATH", str(tmp_path / "a.db"))
+    first = DatabaseConfig.from_env()
+    assert first.sqlite_path == (tmp_path / "a.db").resolve()
+
+    monkeypatch.setenv("JDEP_DB_PATH", str(tmp_path / "b.db"))
+    assert DatabaseConfig.from_env() is first
+
+    _config_from_env.cache_clear()
+    assert DatabaseConfig.from_env().sqlite_path == (tmp_path / "b.db").resolve()
+
+
+def test_from_env_reads_insert_page_size(monkeypatch, fresh_env_config) -> None:
+    monkeypatch.setenv("JDEP_DB_TYPE", "sqlite")
+    monkeypatch.setenv("JDEP_INSERT_PAGE_SIZE", "250")
+    assert DatabaseConfig.from_env().insert_page_size == 250
+
+
+@pytest.mark.parametrize("page_size", [0, 16384])
+def test_validate_rejects_insert_page_size_out_of_range(tmp_path, page_size) -> None:
+    config = DatabaseConfig(db_type="sqlite", sqlite_path=tmp_path / "a.db", insert_page_size=page_size)
+    with pytest.raises(ValueError, match="JDEP_INSERT_PAGE_SIZE"):
+        config.validate()
+    # 16383 rows x 4 columns still fits PostgreSQL's 65535 bind parameters.
+    DatabaseConfig(db_type="sqlite", sqlite_path=tmp_path / "a.db", insert_page_size=16383).validate()
@@ -7,12 +7,9 @@ import main
 
 from fastapi.testclient import TestClient
 
-from fastapi.testclient import TestClient
-
 
-def test_export_page_lists_tables() -> None:
-    client = TestClient(main.app)
-    res = client.get("/export")
+def test_export_page_lists_tables(app_client: TestClient) -> None:
+    res = app_client.get("/export")
     assert res.status_code == 200
 
     html = res.text
@@ -24,46 +21,62 @@ def test_export_page_lists_tables() -> None:
     assert "/export/dependencyedge.csv" in html
 
 
-def test_export_table_csv_artifact_has_header_and_rows(tmp_path) -> None:
+def test_export_table_csv_artifact_has_header_and_rows(app_client: TestClient) -> None:
     # Insert one row via the app's DB engine.
     from sqlmodel import Session
     from uuid import uuid4
 
     from j_dep_analyzer.db_models import Artifact
 
-    # Use TestClient as context manager to trigger startup event (init_db)
-    with TestClient(main.app) as client:
-        gav = f"test:{uuid4().hex}:1"
-        with Session(main._engine()) as session:
-            session.add(Artifact(gav=gav, group_id="test", artifact_id="a", version="1"))
-            session.commit()
+    # The session-wide client has already run the startup event (init_db).
+    gav = f"test:{uuid4().hex}:1"
+    with Session(main._engine()) as session:
+        session.add(Artifact(gav=gav, group_id="test", artifact_id="a", version="1"))
+        session.commit()
 
-        res = client.get("/export/artifact.csv")
-        assert res.status_code == 200
-        assert res.headers.get("content-type", "").startswith("text/csv")
+    res = app_client.get("/export/artifact.csv")
+    assert res.status_code == 200
+    assert res.headers.get("content-type", "").startswith("text/csv")
 
-        reader = csv.reader(io.StringIO(res.text))
-        rows = list(reader)
-        assert rows[0] == ["gav", "group_id", "artifact_id", "version"]
-        assert [gav, "test", "a", "1"] in rows
+    reader = csv.reader(io.StringIO(res.text))
+    rows = list(reader)
+    assert rows[0] == ["gav", "group_id", "artifact_id", "version"]
+    assert [gav, "test", "a", "1"] in rows
 
 
-def test_export_table_csv_rejects_invalid_table_name() -> None:
-    client = TestClient(main.app)
-    res = client.get("/export/artifact;drop.csv")
+def test_iter_table_csv_streams_same_csv_in_process(tmp_path) -> None:
+    from sqlmodel import Session
+
+    from j_dep_analyzer.db import create_sqlite_engine, init_db
+    from j_dep_analyzer.db_models import Artifact
+
+    engine = create_sqlite_engine(tmp_path / "iter-export.db")
+    init_db(engine)
+    with Session(engine) as session:
+        session.add(Artifact(gav="g:a:1", group_id="g", artifact_id="a", version="1"))
+        session.commit()
+
+        chunks = main.iter_table_csv(session, "artifact")
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+
+    assert rows == [["gav", "group_id", "artifact_id", "version"], ["g:a:1", "g", "a", "1"]]
+
+
+def test_export_table_csv_rejects_invalid_table_name(app_client: TestClient) -> None:
+    res = app_client.get("/export/artifact;drop.csv")
     assert res.status_code == 400
 
 
-def test_export_table_csv_404_for_unknown_table() -> None:
-    client = TestClient(main.app)
-    res = client.get("/export/not_a_table.csv")
+def test_export_table_csv_404_for_unknown_table(app_client: TestClient) -> None:
+    res = app_client.get("/export/not_a_table.csv")
     assert res.status_code == 404
 
 
-def test_export_dependencies_csv_not_truncated_by_hidden_limit(tmp_path) -> None:
+def test_export_dependencies_csv_not_truncated_by_hidden_limit(app_client: TestClient, tmp_path) -> None:
     # Regression test: the dependencies export used to silently truncate because
     # the backend limited edges to 2000 inside the row builder.
     from pathlib import Path
+    from sqlalchemy import insert
     from sqlmodel import Session
     from uuid import uuid4
 
@@ -87,26 +100,19 @@ def test_export_dependencies_csv_not_truncated_by_hidden_limit(tmp_path) -> None
         init_db(create_sqlite_engine(test_db_path))
 
         sink_gav = f"test:sink:{uuid4().hex}"
+        edge_count = 2505
+        src_gavs = [f"test:src{i}:{uuid4().hex}" for i in range(edge_count)]
+        artifacts = [{"gav": sink_gav, "group_id": "test", "artifact_id": "sink", "version": "1"}] + [
+            {"gav": g, "group_id": "test", "artifact_id": f"src{i}", "version": "1"} for i, g in enumerate(src_gavs)
+        ]
+        edges = [{"from_gav": g, "to_gav": sink_gav, "scope": "compile", "optional": False} for g in src_gavs]
+        # Core executemany: one statement per table instead of one ORM flush per row.
         with Session(main._engine()) as session:
-            session.add(Artifact(gav=sink_gav, group_id="test", artifact_id="sink", version="1"))
-
-            edge_count = 2505
-            for i in range(edge_count):
-                src_gav = f"test:src{i}:{uuid4().hex}"
-                session.add(Artifact(gav=src_gav, group_id="test", artifact_id=f"src{i}", version="1"))
-                session.add(
-                    DependencyEdge(
-                        from_gav=src_gav,
-                        to_gav=sink_gav,
-                        scope="compile",
-                        optional=False,
-                    )
-                )
-
+            session.execute(insert(Artifact), artifacts)
+            session.execute(insert(DependencyEdge), edges)
             session.commit()
 
-        client = TestClient(main.app)
-        res = client.get("/api/dependencies/export")
+        res = app_client.get("/api/dependencies/export")
         assert res.status_code == 200
         assert res.headers.get("content-type", "").startswith("text/csv")
 
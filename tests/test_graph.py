@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from j_dep_analyzer.graph import (
+    DepGraph,
+    aggregate_graph,
+    build_graph,
+    graph_to_cytoscape_columns,
+    graph_to_cytoscape_elements,
+    nodes_within_depth,
+)
+from j_dep_analyzer.models import GAV, Dependency, MavenProject
+
+
+def _atomic() -> DepGraph:
+    g = DepGraph()
+    g.add_edge("com.acme:app:1.0", "org.slf4j:slf4j-api:2.0.12", scope="compile", optional=None)
+    g.add_edge("com.acme:app:1.0", "junit:junit:4.13.2", scope="test", optional=None)
+    g.add_edge("com.acme:app:2.0", "org.slf4j:slf4j-api:2.0.13", scope="runtime", optional=True)
+    g.add_edge("com.acme:app:2.0", "org.slf4j:slf4j-api:2.0.12", scope="compile", optional=None)
+    return g
+
+
+def test_aggregate_graph_without_aggregation_keeps_nodes() -> None:
+    out = aggregate_graph(_atomic(), show_group=True, show_version=True)
+
+    assert set(out.nodes) == set(_atomic().nodes)
+    assert out.nodes["com.acme:app:1.0"]["merged_count"] == 1
+    assert out.nodes["com.acme:app:1.0"]["version"] == "1.0"
+    assert out.edges["com.acme:app:1.0", "junit:junit:4.13.2"]["scope"] == "test"
+
+
+def test_aggregate_graph_without_aggregation_pads_partial_ids() -> None:
+    g = _atomic()
+    g.add_edge("lonely", "com.acme:app:1.0")
+
+    out = aggregate_graph(g, show_group=True, show_version=True)
+
+    assert "Unknown:lonely:Unknown" in out.nodes
+    assert out.edges["Unknown:lonely:Unknown", "com.acme:app:1.0"]["scope"] == "compile"
+
+
+def test_aggregate_graph_merges_versions_and_scopes() -> None:
+    out = aggregate_graph(_atomic(), show_group=True, show_version=False)
+
+    assert set(out.nodes) == {"com.acme:app", "org.slf4j:slf4j-api", "junit:junit"}
+    assert out.nodes["com.acme:app"]["merged_count"] == 2
+    edge = out.edges["com.acme:app", "org.slf4j:slf4j-api"]
+    assert edge["scope"] == "compile, runtime"
+    assert edge["optional_any"] is True
+
+
+def test_aggregate_graph_artifact_only() -> None:
+    out = aggregate_graph(_atomic(), show_group=False, show_version=False)
+
+    assert set(out.nodes) == {"app", "slf4j-api", "junit"}
+    assert out.nodes["app"]["artifact_id"] == "app"
+    assert out.nodes["app"]["group_id"] == "Unknown"
+
+
+def test_nodes_within_depth() -> None:
+    g = DepGraph()
+    for u, v in [("a", "b"), ("b", "c"), ("c", "d")]:
+        g.add_edge(u, v)
+
+    assert nodes_within_depth(g, "a", direction="forward", depth=2) == {"a", "b", "c"}
+    assert nodes_within_depth(g, "d", direction="reverse", depth=1) == {"c", "d"}
+    assert nodes_within_depth(g, "b", direction="forward", depth=None) == {"b", "c", "d"}
+    assert nodes_within_depth(g, "missing", direction="forward", depth=1) == {"a", "b", "c", "d"}
+
+
+def test_nodes_within_depth_memoized_until_new_edge() -> None:
+    g = DepGraph()
+    g.add_edge("a", "b")
+
+    first = nodes_within_depth(g, "a", direction="forward", depth=1)
+    assert nodes_within_depth(g, "a", direction="forward", depth=1) is first
+
+    g.add_edge("b", "c")
+    assert nodes_within_depth(g, "a", direction="forward", depth=2) == {"a", "b", "c"}
+    g.add_edge("a", "d")
+    assert nodes_within_depth(g, "a", direction="forward", depth=1) == {"a", "b", "d"}
+
+
+def test_graph_to_cytoscape_elements_reverse_highlight() -> None:
+    out = aggregate_graph(_atomic(), show_group=True, show_version=False)
+    elements = graph_to_cytoscape_elements(
+        out, root_id="org.slf4j:slf4j-api", direction="reverse", show_version=False
+    )
+
+    nodes = {e["data"]["id"]: e for e in elements if "source" not in e["data"]}
+    edges = [e for e in elements if "source" in e["data"]]
+    assert nodes["org.slf4j:slf4j-api"]["classes"] == "root aggregated"
+    assert nodes["com.acme:app"]["classes"] == "highlight aggregated"
+    assert nodes["com.acme:app"]["data"]["label"] == "app"
+    assert nodes["com.acme:app"]["data"]["merged_count"] == 2
+    assert {(e["data"]["source"], e["data"]["target"]) for e in edges} == {
+        ("com.acme:app", "org.slf4j:slf4j-api"),
+        ("com.acme:app", "junit:junit"),
+    }
+
+
+def test_graph_to_cytoscape_labels_nodes_without_attributes_by_artifact() -> None:
+    # Edge-only nodes carry no artifact_id attribute.
+    kwargs = {"root_id": None, "direction": "forward", "show_version": False}
+    elements = graph_to_cytoscape_elements(_atomic(), **kwargs)
+    columns = graph_to_cytoscape_columns(_atomic(), **kwargs)
+
+    labels = {e["data"]["id"]: e["data"]["label"] for e in elements if "source" not in e["data"]}
+    assert labels["com.acme:app:1.0"] == "app"
+    assert labels["junit:junit:4.13.2"] == "junit"
+    assert dict(zip(columns["nodes"]["id"], columns["nodes"]["label"])) == labels
+
+
+def test_graph_to_cytoscape_columns_match_elements() -> None:
+    out = aggregate_graph(_atomic(), show_group=True, show_version=False)
+    kwargs = {"root_id": "org.slf4j:slf4j-api", "direction": "reverse", "show_version": False}
+    elements = graph_to_cytoscape_elements(out, **kwargs)
+    columns = graph_to_cytoscape_columns(out, **kwargs)
+
+    nodes, edges = columns["nodes"], columns["edges"]
+    rebuilt = [
+        {"data": {k: nodes[k][i] for k in nodes if k != "classes"}, "classes": nodes["classes"][i]}
+        for i in range(len(nodes["id"]))
+    ] + [
+        {"data": {"id": f"{s}__{t}", "source": s, "target": t, "scope": sc, "optional": o}}
+        for s, t, sc, o in zip(edges["source"], edges["target"], edges["scope"], edges["optional"])
+    ]
+    assert rebuilt == elements
+
+
+def test_graph_to_cytoscape_elements_node_filter_matches_subgraph() -> None:
+    g = DepGraph()
+    for u, v in [("a", "b"), ("b", "c"), ("x", "c"), ("c", "d")]:
+        g.add_edge(u, v, scope="compile")
+    keep = {"a", "b", "c"}
+
+    filtered = graph_to_cytoscape_elements(g, root_id="c", direction="reverse", nodes=keep)
+    copied = graph_to_cytoscape_elements(g.subgraph(keep), root_id="c", direction="reverse")
+
+    def key(e: dict) -> str:
+        return e["data"]["id"]
+
+    assert sorted(filtered, key=key) == sorted(copied, key=key)
+    assert {key(e) for e in filtered if "source" not in e["data"]} == keep
+    # The source graph is left untouched.
+    assert g.number_of_nodes() == 5
+
+
+def test_dep_graph_traversal_and_subgraph() -> None:
+    g = DepGraph()
+    for u, v in [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")]:
+        g.add_edge(u, v, scope="compile")
+    g.add_edge("a", "b", scope="test")
+
+    assert g.number_of_edges() == 4
+    assert g.edges["a", "b"]["scope"] == "test"
+    # Cycle: the source itself is never its own ancestor/descendant.
+    assert g.descendants("a") == {"b", "c", "d"}
+    assert g.ancestors("d") == {"a", "b", "c"}
+
+    sub = g.subgraph({"a", "b", "missing"})
+    assert set(sub.nodes) == {"a", "b"}
+    assert list(sub.edges) == [("a", "b")]
+    assert sub.predecessors("b") == ["a"]
+
+
+def test_dep_graph_ancestors_cache_invalidated_on_new_edge() -> None:
+    g = DepGraph()
+    g.add_edge("a", "b")
+
+    first = g.ancestors("b")
+    assert first == {"a"}
+    assert g.ancestors("b") is first
+
+    g.add_edge("c", "a")
+    assert g.ancestors("b") == {"a", "c"}
+
+    # Carried into a subgraph only while the whole ancestor set is kept.
+    assert g.subgraph({"a", "b", "c"}).ancestors("b") is g.ancestors("b")
+    assert g.subgraph({"a", "b"}).ancestors("b") == {"a"}
+
+
+def test_build_graph_bulk_adds_projects_and_edges() -> None:
+    lib = GAV(group_id="g", artifact_id="lib", version="1")
+    projects = [
+        MavenProject(project=GAV(group_id="g", artifact_id="app", version="1"), dependencies=[
+            Dependency(gav=lib, scope="test"),
+            Dependency(gav=lib, scope="compile"),
+        ]),
+        MavenProject(project=GAV(group_id="g", artifact_id="solo", version="1")),
+    ]
+
+    g = build_graph(projects)
+
+    assert set(g.nodes) == {"g:app:1", "g:lib:1", "g:solo:1"}
+    # A re-declared dependency updates the edge, like repeated add_edge calls.
+    assert g.edges["g:app:1", "g:lib:1"]["scope"] == "compile"
+    assert g.predecessors("g:lib:1") == ["g:app:1"]
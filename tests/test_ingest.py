@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+from j_dep_analyzer.db import create_sqlite_engine, init_db
+from j_dep_analyzer.db_models import Artifact, DependencyEdge
+from j_dep_analyzer.ingest import ingest_projects
+from j_dep_analyzer.models import GAV, Dependency, MavenProject
+from j_dep_analyzer.queries import graph_version
+
+
+def _project() -> MavenProject:
+    return MavenProject(
+        project=GAV(group_id="com.acme", artifact_id="app", version="1.0"),
+        dependencies=[
+            Dependency(gav=GAV(group_id="org.slf4j", artifact_id="slf4j-api", version="2.0.12")),
+            Dependency(gav=GAV(group_id="junit", artifact_id="junit", version="4.13.2"), scope="test"),
+            # Re-declared dependency: must be stored once.
+            Dependency(gav=GAV(group_id="org.slf4j", artifact_id="slf4j-api", version="2.0.12")),
+        ],
+    )
+
+
+def test_ingest_projects_inserts_artifacts_and_edges(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(tmp_path / "ingest.db")
+    init_db(engine)
+
+    with Session(engine) as session:
+        projects, edges = ingest_projects(session, [_project()])
+        session.commit()
+
+    assert (projects, edges) == (1, 2)
+    with Session(engine) as session:
+        gavs = set(session.exec(select(Artifact.gav)).all())
+        stored = session.exec(select(DependencyEdge)).all()
+
+    assert gavs == {"com.acme:app:1.0", "org.slf4j:slf4j-api:2.0.12", "junit:junit:4.13.2"}
+    assert {(e.to_gav, e.scope) for e in stored} == {
+        ("org.slf4j:slf4j-api:2.0.12", "compile"),
+        ("junit:junit:4.13.2", "test"),
+    }
+
+
+def test_ingest_projects_is_idempotent(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(tmp_path / "ingest.db")
+    init_db(engine)
+
+    for _ in range(2):
+        with Session(engine) as session:
+            _, edges = ingest_projects(session, [_project()])
+            session.commit()
+
+    assert edges == 0
+    with Session(engine) as session:
+        assert len(session.exec(select(DependencyEdge)).all()) == 2
+        # Only the first ingest changed anything.
+        assert graph_version(session) == 1
+
+
+def test_ingest_projects_scope_filter(tmp_path: Path) -> None:
+    engine = create_sqlite_engine(tmp_path / "ingest.db")
+    init_db(engine)
+
+    with Session(engine) as session:
+        _, edges = ingest_projects(session, [_project()], scopes=["compile", "runtime"])
+        session.commit()
+
+    assert edges == 1
+    with Session(engine) as session:
+        gavs = set(session.exec(select(Artifact.gav)).all())
+    # Filtered-out dependencies don't create artifacts either.
+    assert "junit:junit:4.13.2" not in gavs
+
+
+def test_concurrent_read_then_write_transactions_wait_for_each_other(tmp_path: Path) -> None:
+    # Same shape as ingest_projects: existence SELECTs, then INSERTs, in one
+    # transaction. The second writer must wait for the lock, not fail.
+    engine = create_sqlite_engine(tmp_path / "ingest.db")
+    init_db(engine)
+    both_read = threading.Barrier(2)
+    errors: list[Exception] = []
+
+    def upload(i: int) -> None:
+        try:
+            with Session(engine) as session, session.begin():
+                session.exec(select(Artifact.gav)).all()
+                both_read.wait()
+                session.add(Artifact(gav=f"g:a{i}:1", group_id="g", artifact_id=f"a{i}", version="1"))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=upload, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with Session(engine) as session:
+        assert len(session.exec(select(Artifact)).all()) == 2
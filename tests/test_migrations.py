@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel
+
+import j_dep_analyzer.db_models  # noqa: F401  (register tables)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _index_names(inspector, table: str) -> set[str]:
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def test_migrations_match_models_using_injected_connection() -> None:
+    cfg = Config(str(ROOT / "alembic.ini"))
+    cfg.set_main_option("script_location", str(ROOT / "migrations"))
+
+    migrated = create_engine("sqlite://")
+    with migrated.connect() as connection:
+        cfg.attributes["connection"] = connection
+        command.upgrade(cfg, "head")
+        migrated_inspector = inspect(connection)
+
+        modeled = create_engine("sqlite://")
+        SQLModel.metadata.create_all(modeled)
+        modeled_inspector = inspect(modeled)
+
+        for table in ("artifact", "dependencyedge", "graphversion"):
+            assert _index_names(migrated_inspector, table) == _index_names(modeled_inspector, table)
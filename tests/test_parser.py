@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from j_dep_analyzer.models import MavenProject
-from j_dep_analyzer.parser import parse_pom
+from j_dep_analyzer.parser import _resolve_placeholders, parse_pom, parse_poms
 
 
 def _write(tmp_path: Path, name: str, content: str) -> Path:
@@ -182,3 +184,41 @@ def test_resolve_properties_for_dependency_version(tmp_path: Path) -> None:
     path = _write(tmp_path, "pom.xml", pom)
     model = parse_pom(path)
     assert model.dependencies[0].gav.compact() == "org.example:lib:2.3.4"
+
+
+def test_resolve_placeholders_nested_and_cyclic() -> None:
+    props = {"a": "${b}-x", "b": "1.${c}", "c": "0", "loop": "${loop}", "empty": ""}
+
+    assert _resolve_placeholders("plain", props) == "plain"
+    assert _resolve_placeholders("${a}/${c}", props) == "1.0-x/0"
+    assert _resolve_placeholders("${loop}", props) == "${loop}"
+    assert _resolve_placeholders("${empty}${missing}", props) == "${empty}${missing}"
+
+
+def test_parse_poms_matches_serial_parse() -> None:
+    # Enough files to take the process pool path.
+    paths = sorted((Path(__file__).parent / "data" / "sample-pom").glob("*.pom"))
+    assert len(paths) >= 8
+
+    serial = [parse_pom(p) for p in paths]
+    # Lazy iterator (fixed chunk size) and list (chunk size from its length).
+    assert list(parse_poms(iter(paths), max_workers=2)) == serial
+    assert list(parse_poms(paths, max_workers=2)) == serial
+
+
+def test_parse_poms_keeps_a_bounded_window_in_flight() -> None:
+    paths = sorted((Path(__file__).parent / "data" / "sample-pom").glob("*.pom"))
+    consumed = 0
+
+    def endless() -> Iterator[Path]:
+        nonlocal consumed
+        while True:
+            consumed += 1
+            yield paths[consumed % len(paths)]
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        results = parse_poms(endless(), max_workers=2, executor=ex)
+        next(results)
+        # 2 workers x 2 chunks of 8 in flight, plus the refill after the first.
+        assert consumed <= 5 * 8
+        results.close()
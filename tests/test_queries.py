@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlmodel import Session
+
+from j_dep_analyzer.db import create_sqlite_engine, init_db
+from j_dep_analyzer.db_models import DependencyEdge
+from j_dep_analyzer.queries import dependents_of
+
+
+def _session(tmp_path: Path) -> Session:
+    engine = create_sqlite_engine(tmp_path / "queries.db")
+    init_db(engine)
+    session = Session(engine)
+    # app -> lib -> core, tool -> core, and a cycle core -> app.
+    for src, dst in [("app", "lib"), ("lib", "core"), ("tool", "core"), ("core", "app")]:
+        session.add(DependencyEdge(from_gav=f"g:{src}:1", to_gav=f"g:{dst}:1", scope="compile"))
+    session.commit()
+    return session
+
+
+def test_dependents_of_direct(tmp_path: Path) -> None:
+    with _session(tmp_path) as session:
+        assert dependents_of(session, "g:core:1") == ["g:lib:1", "g:tool:1"]
+        assert dependents_of(session, "g:missing:1") == []
+
+
+def test_dependents_of_transitive_handles_cycles(tmp_path: Path) -> None:
+    with _session(tmp_path) as session:
+        assert dependents_of(session, "g:core:1", transitive=True) == ["g:app:1", "g:lib:1", "g:tool:1"]
+        assert dependents_of(session, "g:core:1", transitive=True, limit=1) == ["g:app:1"]